@@ -4,6 +4,7 @@ A Sphinx extension that provides autodoc-like functionality for TypeScript
 files using Tree-sitter for parsing.
 """
 
+from pathlib import Path
 from typing import Any
 
 from sphinx.application import Sphinx
@@ -15,6 +16,18 @@ from .directives import (
     TSAutoInterfaceDirective,
 )
 from .domain import TypeScriptDomain
+from .parser import get_parse_cache
+from .parser.parse_cache import CACHE_FILENAME
+
+
+def _load_parse_cache(app: Sphinx) -> None:
+    """Load the sources parsed by the previous build."""
+    get_parse_cache().load(Path(app.doctreedir) / CACHE_FILENAME)
+
+
+def _save_parse_cache(_app: Sphinx, _exception: Exception | None) -> None:
+    """Persist the parsed sources for the next build."""
+    get_parse_cache().save()
 
 
 def setup(app: Sphinx) -> dict[str, Any]:
@@ -52,6 +65,16 @@ def setup(app: Sphinx) -> dict[str, Any]:
     app.add_config_value(
         "sphinx_ts_show_source_links", default=True, rebuild="env", types=[bool]
     )
+    app.add_config_value(
+        "sphinx_ts_multi_block_examples",
+        default=False,
+        rebuild="env",
+        types=[bool],
+    )
+
+    # Keep parsed sources between builds
+    app.connect("builder-inited", _load_parse_cache)
+    app.connect("build-finished", _save_parse_cache)
 
     return {
         "version": "0.1.0",
@@ -8,8 +8,12 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+from weakref import WeakKeyDictionary
 
 from docutils import nodes
 from docutils.core import publish_doctree
@@ -20,10 +24,246 @@ from sphinx import addnodes
 from sphinx.util import logging as sphinx_logging
 from sphinx.util.docutils import SphinxDirective
 
-from sphinx_ts.parser import TSDocComment, TSMethod, TSParser, TSProperty
+from sphinx_ts.parser import (
+    TSDocComment,
+    TSMethod,
+    TSParser,
+    TSProperty,
+    get_parse_cache,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sphinx_ts.domain import TypeScriptDomain
 
 logger = sphinx_logging.getLogger(__name__)
 
+# Map object types to their plural keys in parsed file data
+_PARSED_DATA_KEYS = {
+    "class": "classes",
+    "interface": "interfaces",
+    "variable": "variables",
+    "function": "functions",
+    "enum": "enums",
+    "type": "types",
+}
+
+# Deprecation notes starting with a version can use ``.. deprecated::``
+_VERSION_PREFIX_RE = re.compile(r"^\s*v?\d+\.\d+")
+
+# Id prefixes and signature classes for the object types documented by
+# the auto-directives
+_STANDARD_OBJTYPES = (
+    "class",
+    "interface",
+    "enum",
+    "enum_member",
+    "variable",
+    "function",
+    "type",
+)
+_ID_PREFIXES = {objtype: f"{objtype}-" for objtype in _STANDARD_OBJTYPES}
+_SIG_CLASSES = {
+    objtype: f"sig-object ts ts-{objtype}" for objtype in _STANDARD_OBJTYPES
+}
+
+# Admonition-style directives that JSDoc tags render as
+_TAG_DIRECTIVES = {
+    "see": "seealso",
+    "seealso": "seealso",
+    "note": "note",
+    "notes": "note",
+    "warning": "warning",
+    "warn": "warning",
+    "todo": "todo",
+}
+
+
+def _append_rst_directive(
+    lines: list[str], name: str, *body: str, argument: str = ""
+) -> None:
+    """Append an RST directive block with an indented body to ``lines``.
+
+    Args:
+    ----
+        lines: The RST lines to extend
+        name: The directive name
+        *body: The directive content lines
+        argument: The directive argument, if any
+
+    """
+    lines.append(f".. {name}:: {argument}" if argument else f".. {name}::")
+    lines.extend(f"   {line}" for line in body)
+    lines.append("")
+
+
+# Separator between examples coalesced into a single literal block
+_EXAMPLE_SEPARATOR = "\n\n// --- example {number} ---\n\n"
+
+# Anything that could be reStructuredText markup: inline markup, roles,
+# references, substitutions, escapes and line-leading block constructs
+# (bullets and enumerators, including empty ones, option lists, directives,
+# doctests, transitions and section adornments of any punctuation character)
+_RST_MARKUP_RE = re.compile(
+    r"[*`_|\\\[\]:<>@]"
+    r"|^\s"
+    r"|^(?:[-+\u2022\u2023\u2043](?:\s|$)|\(?[a-zA-Z\d#]+[.)](?:\s|$)|\.\.)"
+    r"|^(?:--?|/)\w"
+    r"|^([!-/:-@\[-`{-~])(?:\1{3,}|\1*\s*$)"
+)
+
+# Signature keywords followed by their separating space, precomputed for
+# the small fixed set of annotations and modifiers used in signatures
+_ANNOTATION_TEXTS = {
+    keyword: f"{keyword} "
+    for keyword in (
+        "class",
+        "interface",
+        "enum",
+        "type",
+        "function",
+        "Constructor",
+        "export",
+        "declare",
+        "const",
+        "let",
+        "var",
+        "abstract",
+        "public",
+        "private",
+        "protected",
+        "static",
+        "readonly",
+        "async",
+    )
+}
+
+
+def _signature_annotation(keyword: str) -> addnodes.desc_annotation:
+    """Create a signature annotation node for a keyword."""
+    text = _ANNOTATION_TEXTS.get(keyword) or f"{keyword} "
+    return addnodes.desc_annotation(text, text)
+
+
+# Formatted RST lines per doc comment, keyed by the skip flags and whether
+# examples are rendered as separate blocks
+_FORMATTED_DOC_COMMENTS: WeakKeyDictionary[
+    TSDocComment, dict[tuple[bool, bool, bool, bool], list[str]]
+] = WeakKeyDictionary()
+
+# Lower-cased object names mapped, per object type, to the first
+# declaration found: (name, object, file path, parsed file data)
+_SourceIndex = dict[str, dict[str, tuple[str, Any, Path, dict[str, Any]]]]
+
+#: Maximum number of parsed doc comment trees kept in memory.
+RST_CACHE_SIZE = 2048
+#: Maximum number of distinct type annotations kept formatted.
+TYPE_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def _format_type_annotation(type_annotation: str) -> str:
+    """Normalize the spacing of a non-empty TypeScript type annotation."""
+    # Clean up the type annotation
+    cleaned = type_annotation.strip()
+    cleaned = cleaned.removeprefix(":").strip()
+
+    # Format union types to have consistent spacing
+    if "|" in cleaned:
+        # Split on union operators and clean each part
+        union_parts = []
+        parts = cleaned.split("|")
+        for part in parts:
+            # Clean up excessive whitespace and newlines
+            clean_part = " ".join(part.split())
+            # Only add non-empty parts (handles leading | characters)
+            if clean_part:
+                union_parts.append(clean_part)
+        # Join with consistent spacing
+        cleaned = " | ".join(union_parts)
+    else:
+        # For non-union types, just normalize whitespace
+        cleaned = " ".join(cleaned.split())
+
+    return cleaned
+
+
+def _is_replayable(children: list[nodes.Node]) -> bool:
+    """Check whether parsed doc comment nodes can be reused as copies.
+
+    Version change notes register a changeset with the environment as they
+    are parsed, and copies of nodes with IDs would duplicate them, so trees
+    containing either are parsed again every time.
+
+    Args:
+    ----
+        children: The parsed top-level nodes
+
+    Returns:
+    -------
+        True if copies of the nodes can stand in for a fresh parse
+
+    """
+    for child in children:
+        if not isinstance(child, nodes.Element):
+            continue
+        for node in child.findall(nodes.Element):
+            if node["ids"] or isinstance(node, addnodes.versionmodified):
+                return False
+    return True
+
+
+class _NodeCache:
+    """Bounded LRU cache of rendered docutils node trees.
+
+    Cached trees are never handed out directly: every hit returns a deep copy
+    so callers are free to attach the result to their own document.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, nodes.Element] = OrderedDict()
+
+    def get(self, key: Any) -> nodes.Element | None:
+        """Return a copy of the cached tree for ``key``, if any.
+
+        Args:
+        ----
+            key: The cache key
+
+        Returns:
+        -------
+            A deep copy of the cached node tree or None on a miss
+
+        """
+        node = self._entries.get(key)
+        if node is None:
+            return None
+        self._entries.move_to_end(key)
+        return node.deepcopy()
+
+    def put(self, key: Any, node: nodes.Element) -> None:
+        """Store a pristine copy of ``node`` under ``key``."""
+        self._store(key, node.deepcopy())
+
+    def put_children(self, key: Any, children: list[nodes.Node]) -> None:
+        """Store pristine copies of ``children`` under ``key``."""
+        holder = nodes.Element()
+        holder.extend([child.deepcopy() for child in children])
+        self._store(key, holder)
+
+    def _store(self, key: Any, node: nodes.Element) -> None:
+        """Insert an entry, evicting the least recently used one if full."""
+        self._entries[key] = node
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached trees."""
+        self._entries.clear()
+
 
 class TSAutoDirective(SphinxDirective):
     """Base class for TypeScript auto-directives."""
@@ -45,6 +285,14 @@ class TSAutoDirective(SphinxDirective):
         "no-index": directives.flag,
     }
 
+    # Parsed doc comment trees, keyed on the document and the generated RST
+    _rst_node_cache = _NodeCache(RST_CACHE_SIZE)
+    # Objects declared in the scanned sources, keyed on the source files and
+    # their modification times
+    _source_index_cache: ClassVar[
+        dict[tuple[tuple[str, int], ...], _SourceIndex]
+    ] = {}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the directive."""
         super().__init__(*args, **kwargs)
@@ -77,61 +325,97 @@ class TSAutoDirective(SphinxDirective):
         object_name: str,
         object_type: str,
     ) -> dict[str, Any] | None:
-        """Find a specific object in TypeScript files."""
-        source_files = self.get_source_files()
+        """Find a specific object in TypeScript files.
+
+        Names are matched case-insensitively; the first declaration in
+        source file order wins.
+        """
+        entry = self._source_index().get(object_name.lower(), {})
+        match = entry.get(object_type)
+        if match is None:
+            return None
 
+        obj_name, obj, file_path, parsed_data = match
+        # Register this object with the domain for cross-ref
+        self._register_object_with_domain(
+            object_type, obj_name, self.env.docname
+        )
+        return {
+            "object": obj,
+            "file_path": file_path,
+            "parsed_data": parsed_data,
+        }
+
+    def find_object_kinds(self, object_name: str) -> frozenset[str]:
+        """Get the object types a name is declared as in the source files.
+
+        Names are matched case-insensitively, like ``find_object_in_files``.
+
+        Args:
+        ----
+            object_name: Name of the object to look up
+
+        Returns:
+        -------
+            The object types declaring the name, empty if there are none
+
+        """
+        return frozenset(self._source_index().get(object_name.lower(), ()))
+
+    def _source_index(self) -> _SourceIndex:
+        """Get the index of objects declared in the source files.
+
+        Every source file is parsed once to build the index, which maps
+        lower-cased names to the first declaration per object type and is
+        reused by all lookups until a source file changes.
+        """
+        source_files = self.get_source_files()
+        try:
+            key = tuple(
+                (str(file_path), file_path.stat().st_mtime_ns)
+                for file_path in source_files
+            )
+        except OSError:
+            # A source file went missing; don't keep an index for it
+            return self._build_source_index(source_files)
+
+        index = self._source_index_cache.get(key)
+        if index is None:
+            index = self._build_source_index(source_files)
+            # Only the current set of sources is worth keeping
+            self._source_index_cache.clear()
+            self._source_index_cache[key] = index
+        return index
+
+    def _build_source_index(self, source_files: list[Path]) -> _SourceIndex:
+        """Parse the source files and index their objects by name.
+
+        Files that did not change since they were last parsed, in this or an
+        earlier build, are served from the persistent parse cache.
+        """
+        parse_cache = get_parse_cache()
+        index: _SourceIndex = {}
         for file_path in source_files:
             try:
-                parsed_data = self.parser.parse_file(file_path)
-
-                # Map object types to their plural forms in parsed data
-                type_mapping = {
-                    "class": "classes",
-                    "interface": "interfaces",
-                    "variable": "variables",
-                    "function": "functions",
-                    "enum": "enums",
-                    "type": "types",
-                }
-                plural_type = type_mapping.get(object_type, object_type + "s")
-                objects = parsed_data.get(plural_type, [])
-
-                for obj in objects:
+                parsed_data = parse_cache.parse_file(self.parser, file_path)
+            except Exception as e:
+                logger.warning("Failed to parse %s: %s", file_path, e)
+                continue
+
+            for object_type, plural_type in _PARSED_DATA_KEYS.items():
+                for obj in parsed_data.get(plural_type, []):
                     # Handle both object-style and dict-style objects
                     if isinstance(obj, dict):
                         obj_name = obj.get("name")
                     else:
                         obj_name = getattr(obj, "name", None)
                     if obj_name:
-                        if obj_name == object_name:
-                            obj_data = {
-                                "object": obj,
-                                "file_path": file_path,
-                                "parsed_data": parsed_data,
-                            }
-                            # Register this object with the domain for cross-ref
-                            self._register_object_with_domain(
-                                object_type, obj_name, self.env.docname
-                            )
-                            return obj_data
-                        if obj_name.lower() == object_name.lower():
-                            # Try case-insensitive match if exact match fails
-                            obj_data = {
-                                "object": obj,
-                                "file_path": file_path,
-                                "parsed_data": parsed_data,
-                            }
-                            # Register this object with the domain for cross-ref
-                            self._register_object_with_domain(
-                                object_type, obj_name, self.env.docname
-                            )
-                            return obj_data
+                        index.setdefault(obj_name.lower(), {}).setdefault(
+                            object_type,
+                            (obj_name, obj, file_path, parsed_data),
+                        )
 
-            except Exception as e:
-                logger.warning("Failed to parse %s: %s", file_path, e)
-                continue
-
-        return None
+        return index
 
     def _generate_source_url(
         self, file_path: str | Path, obj: Any = None
@@ -202,16 +486,15 @@ class TSAutoDirective(SphinxDirective):
             # Use base URL with standard GitHub format
             source_url = f"{base_url.rstrip('/')}/blob/{branch}/{relative_path}"
 
-        # Add line numbers if available
-        if obj and hasattr(obj, "start_line") and obj.start_line:
-            if (
-                hasattr(obj, "end_line")
-                and obj.end_line
-                and obj.end_line != obj.start_line
-            ):
-                source_url += f"#L{obj.start_line}-L{obj.end_line}"
+        # Add line numbers if available; type aliases are plain dicts
+        # without them
+        start_line = getattr(obj, "start_line", None)
+        if start_line:
+            end_line = obj.end_line
+            if end_line and end_line != start_line:
+                source_url += f"#L{start_line}-L{end_line}"
             else:
-                source_url += f"#L{obj.start_line}"
+                source_url += f"#L{start_line}"
 
         return source_url
 
@@ -261,6 +544,37 @@ class TSAutoDirective(SphinxDirective):
 
         signature_node += nodes.Text("]")
 
+    def _process_object_any(
+        self,
+        object_name: str,
+        object_types: tuple[str, ...],
+    ) -> tuple[str, dict[str, Any]] | tuple[None, None]:
+        """Find and register an object declared as any of several types.
+
+        The types are tried in order, skipping any the name is not declared
+        as, so names that are not declared at all never scan the sources.
+
+        Args:
+        ----
+            object_name: Name of the object to find
+            object_types: Object types to try, in order of preference
+
+        Returns:
+        -------
+            The matching object type and its data, or ``(None, None)``
+
+        """
+        kinds = self.find_object_kinds(object_name)
+        for object_type in object_types:
+            if object_type not in kinds:
+                continue
+            result = self._process_object_common(
+                object_name, object_type, log_level=logging.DEBUG
+            )
+            if result:
+                return object_type, result
+        return None, None
+
     def _register_object_with_domain(
         self,
         obj_type: str,
@@ -281,14 +595,20 @@ class TSAutoDirective(SphinxDirective):
         """
         # Get the TypeScript domain
         # Register the object with the TypeScript domain for cross-referencing
-        ts_domain = self.env.get_domain("ts")
+        ts_domain = cast("TypeScriptDomain", self.env.get_domain("ts"))
 
-        # Register the object with the domain - ensure obj_type is a string
-        obj_type_str = str(obj_type)
-        ts_domain.data["objects"].setdefault(obj_type_str, {})
+        # Register the object with the domain - ensure obj_type is a string.
+        # Object types, names and docnames are interned: the same strings are
+        # used as keys and compared over and over while resolving
+        # cross-references.
+        obj_type_str = sys.intern(str(obj_type))
+        name = sys.intern(name)
+        docname = sys.intern(docname)
 
         # Store as a tuple with docname, display name, and noindex flag
-        ts_domain.data["objects"][obj_type_str][name] = (docname, name, noindex)
+        ts_domain.add_objects(
+            docname, {(obj_type_str, name): (docname, name, noindex)}
+        )
 
     def format_doc_comment(
         self,
@@ -298,10 +618,40 @@ class TSAutoDirective(SphinxDirective):
         skip_returns: bool = False,
         skip_examples: bool = False,
     ) -> list[str]:
-        """Format a JSDoc comment as reStructuredText."""
+        """Format a JSDoc comment as reStructuredText.
+
+        Doc comments do not change after parsing, so the formatted lines are
+        cached per comment object, flag combination and example layout.
+        """
         if not doc_comment:
             return []
 
+        flags = (
+            skip_params,
+            skip_returns,
+            skip_examples,
+            not skip_examples and self._use_multi_block_examples(doc_comment),
+        )
+        formatted = _FORMATTED_DOC_COMMENTS.setdefault(doc_comment, {})
+        cached = formatted.get(flags)
+        if cached is None:
+            cached = formatted[flags] = self._format_doc_comment_lines(
+                doc_comment,
+                skip_params=skip_params,
+                skip_returns=skip_returns,
+                skip_examples=skip_examples,
+            )
+        return list(cached)
+
+    def _format_doc_comment_lines(
+        self,
+        doc_comment: TSDocComment,
+        *,
+        skip_params: bool,
+        skip_returns: bool,
+        skip_examples: bool,
+    ) -> list[str]:
+        """Build the reStructuredText lines for a JSDoc comment."""
         lines = []
 
         # Add description with better paragraph handling
@@ -330,23 +680,20 @@ class TSAutoDirective(SphinxDirective):
             )
 
             # Check if deprecated text starts with a version number
-            version_pattern = r"^\s*v?\d+\.\d+"
-            if re.match(version_pattern, deprecated_text):
+            if _VERSION_PREFIX_RE.match(deprecated_text):
                 # Text starts with version, use standard deprecated directive
-                lines.extend([f".. deprecated:: {deprecated_text}", ""])
+                _append_rst_directive(
+                    lines, "deprecated", argument=deprecated_text
+                )
             else:
                 # No version number, use warning directive to avoid parsing
-                lines.extend(
-                    [
-                        ".. warning::",
-                        f"   **Deprecated:** {deprecated_text}",
-                        "",
-                    ]
+                _append_rst_directive(
+                    lines, "warning", f"**Deprecated:** {deprecated_text}"
                 )
 
         # Add since version with cleaner formatting
         if doc_comment.since:
-            lines.extend([".. versionadded::", f"   {doc_comment.since}", ""])
+            _append_rst_directive(lines, "versionadded", doc_comment.since)
 
         # Add parameters only if not skipped
         if not skip_params:
@@ -377,12 +724,10 @@ class TSAutoDirective(SphinxDirective):
             lines.append(f"``{param_name}``")
             if param_desc:
                 # Proper indentation for definition list items
-                desc_lines = param_desc.strip().split("\n")
-                for i, line in enumerate(desc_lines):
-                    if i == 0:
-                        lines.append(f"    {line.strip()}")
-                    else:
-                        lines.append(f"    {line.strip()}")
+                lines.extend(
+                    f"    {line.strip()}"
+                    for line in param_desc.strip().split("\n")
+                )
             else:
                 lines.append("    ")
             lines.append("")
@@ -460,10 +805,11 @@ class TSAutoDirective(SphinxDirective):
     def _format_examples(self, doc_comment: TSDocComment) -> list[str]:
         """Format example documentation with better styling."""
         lines = []
-        if doc_comment.examples:
+        blocks = self._example_blocks(doc_comment)
+        if blocks:
             lines.extend(["**Examples:**", ""])
 
-            for i, example in enumerate(doc_comment.examples):
+            for i, block in enumerate(blocks):
                 # Add separator between multiple examples
                 if i > 0:
                     lines.append("")
@@ -471,16 +817,11 @@ class TSAutoDirective(SphinxDirective):
                 # Format code block with proper indentation
                 lines.extend([".. code-block:: typescript", ""])
 
-                # Clean up and indent the example code
-                example_lines = example.strip().split("\n")
-                for line in example_lines:
-                    lines.append(f"   {line}")
+                # Indent the example code
+                lines.extend(
+                    f"   {line}" if line else "" for line in block.split("\n")
+                )
                 lines.append("")
-
-            lines.append("")
-            # Remove final empty line to avoid double spacing
-            if lines and lines[-1] == "":
-                lines.pop()
         return lines
 
     def _format_other_tags(self, doc_comment: TSDocComment) -> list[str]:
@@ -495,15 +836,11 @@ class TSAutoDirective(SphinxDirective):
                 if not clean_value:
                     continue
 
-                if tag_name.lower() in ["see", "seealso"]:
-                    lines.extend([".. seealso::", f"   {clean_value}", ""])
-                elif tag_name.lower() in ["note", "notes"]:
-                    lines.extend([".. note::", f"   {clean_value}", ""])
-                elif tag_name.lower() in ["warning", "warn"]:
-                    lines.extend([".. warning::", f"   {clean_value}", ""])
-                elif tag_name.lower() == "todo":
-                    lines.extend([".. todo::", f"   {clean_value}", ""])
-                elif tag_name.lower() in ["throws", "throw"]:
+                lower_name = tag_name.lower()
+                directive_name = _TAG_DIRECTIVES.get(lower_name)
+                if directive_name:
+                    _append_rst_directive(lines, directive_name, clean_value)
+                elif lower_name in {"throws", "throw"}:
                     lines.extend(["**Raises:**", f"{clean_value}", ""])
                 else:
                     # For unknown tags, use a generic format
@@ -514,32 +851,15 @@ class TSAutoDirective(SphinxDirective):
         return lines
 
     def format_type_annotation(self, type_annotation: str | None) -> str:
-        """Format TypeScript type annotation."""
+        """Format TypeScript type annotation.
+
+        The same few types recur throughout a project, so the formatted
+        result is memoized per annotation string.
+        """
         if not type_annotation:
             return "any"
 
-        # Clean up the type annotation
-        cleaned = type_annotation.strip()
-        cleaned = cleaned.removeprefix(":").strip()
-
-        # Format union types to have consistent spacing
-        if "|" in cleaned:
-            # Split on union operators and clean each part
-            union_parts = []
-            parts = cleaned.split("|")
-            for part in parts:
-                # Clean up excessive whitespace and newlines
-                clean_part = " ".join(part.split())
-                # Only add non-empty parts (handles leading | characters)
-                if clean_part:
-                    union_parts.append(clean_part)
-            # Join with consistent spacing
-            cleaned = " | ".join(union_parts)
-        else:
-            # For non-union types, just normalize whitespace
-            cleaned = " ".join(cleaned.split())
-
-        return cleaned
+        return _format_type_annotation(type_annotation)
 
     def format_optional_parameter(
         self,
@@ -650,19 +970,21 @@ class TSAutoDirective(SphinxDirective):
 
         """
         param_str = param["name"]
+        param_type = param.get("type")
+        default = param.get("default")
 
         # Add type if present
-        if param.get("type"):
-            type_str = self.format_parameter_type(param.get("type"))
+        if param_type:
+            type_str = self.format_parameter_type(param_type)
             param_str += f": {type_str}"
 
         # Add ? for optional parameters (only if no default value)
-        if param.get("optional") and not param.get("default"):
+        if param.get("optional") and not default:
             param_str += "?"
 
         # Add default value if present
-        if param.get("default"):
-            param_str += f" = {param.get('default')}"
+        if default:
+            param_str += f" = {default}"
 
         return param_str
 
@@ -717,6 +1039,10 @@ class TSAutoDirective(SphinxDirective):
             object_type, object_name, self.env.docname
         )
 
+        # Record the source file as a dependency of this document, so Sphinx
+        # keeps reusing the pickled doctree until that file changes
+        self.env.note_dependency(str(result["file_path"]))
+
         return result
 
     def _format_method_common(
@@ -772,13 +1098,12 @@ class TSAutoDirective(SphinxDirective):
         sig += paramlist
 
         # Add each parameter in a more compact format
-        if method.parameters:
-            for param in method.parameters:
-                parameter = addnodes.desc_parameter("", "")
-                paramlist += parameter
+        for param in method.parameters:
+            parameter = addnodes.desc_parameter("", "")
+            paramlist += parameter
 
-                # Use the shared parameter formatting helper
-                self.format_parameter_nodes(parameter, param)
+            # Use the shared parameter formatting helper
+            self.format_parameter_nodes(parameter, param)
 
         # Add return type on the same line as the method signature
         if method.return_type:
@@ -848,6 +1173,14 @@ class TSAutoDirective(SphinxDirective):
         if method.doc_comment and method.doc_comment.params:
             documented_params = method.doc_comment.params
 
+        # The signature already shows names, types and defaults, so the
+        # section only adds something when at least one parameter has a
+        # description
+        if not any(
+            param["name"] in documented_params for param in method.parameters
+        ):
+            return
+
         # Add parameters section with better styling
         param_section = nodes.section()
         param_section["ids"] = ["parameters"]
@@ -861,6 +1194,10 @@ class TSAutoDirective(SphinxDirective):
 
         # Add parameters as definition list items
         for param in method.parameters:
+            name = param["name"]
+            param_type = param.get("type")
+            default = param.get("default")
+
             # Create definition list item
             def_item = nodes.definition_list_item()
             definition_list.append(def_item)
@@ -870,37 +1207,30 @@ class TSAutoDirective(SphinxDirective):
             def_item.append(term)
 
             # Add parameter name with optional marker
-            param_name = nodes.literal(text=param["name"])
-            term.append(param_name)
+            term.append(nodes.literal(text=name))
 
             if param.get("optional", False):
                 term.append(nodes.Text("?"))
 
             # Add type information
-            if param.get("type"):
+            if param_type:
                 term.append(nodes.Text(": "))
-                formatted_type = self.format_parameter_type(
-                    param.get("type", "")
-                )
-                type_node = nodes.emphasis(text=formatted_type)
-                term.append(type_node)
+                formatted_type = self.format_parameter_type(param_type)
+                term.append(nodes.emphasis(text=formatted_type))
 
             # Add default value if present
-            if param.get("default"):
-                term.append(nodes.Text(f" = {param.get('default')}"))
+            if default:
+                term.append(nodes.Text(f" = {default}"))
 
-            # Create definition (parameter description)
+            # Create definition (parameter description); undocumented
+            # parameters keep an empty definition to stay well-formed
             definition = nodes.definition()
             def_item.append(definition)
 
-            if param["name"] in documented_params:
+            if name in documented_params:
                 desc_para = nodes.paragraph()
-                desc_para.append(nodes.Text(documented_params[param["name"]]))
+                desc_para.append(nodes.Text(documented_params[name]))
                 definition.append(desc_para)
-            else:
-                # Add empty paragraph to maintain structure
-                empty_para = nodes.paragraph()
-                definition.append(empty_para)
 
         content.append(param_section)
 
@@ -942,7 +1272,7 @@ class TSAutoDirective(SphinxDirective):
         sig += prop_name_node
 
         # Add optional marker for properties if needed
-        if hasattr(prop, "is_optional") and prop.is_optional:
+        if prop.is_optional:
             optional_node = nodes.inline("?", "?")
             optional_node["classes"] = ["optional-marker"]
             sig += optional_node
@@ -956,7 +1286,7 @@ class TSAutoDirective(SphinxDirective):
             sig += type_node
 
         # Add default value if present
-        if hasattr(prop, "default_value") and prop.default_value:
+        if prop.default_value:
             sig += nodes.Text(f" = {prop.default_value}")
 
         # Add content container
@@ -993,7 +1323,11 @@ class TSAutoDirective(SphinxDirective):
             doc_comment: The doc comment containing examples
 
         """
-        if not (doc_comment and doc_comment.examples):
+        if not doc_comment:
+            return
+
+        blocks = self._example_blocks(doc_comment)
+        if not blocks:
             return
 
         # Create examples section with consistent styling
@@ -1003,16 +1337,7 @@ class TSAutoDirective(SphinxDirective):
         examples_title = nodes.title(text="Examples")
         examples_section.append(examples_title)
 
-        # Process each example individually for better separation
-        for i, example in enumerate(doc_comment.examples):
-            # Add spacing between multiple examples
-            if i > 0:
-                separator = nodes.paragraph()
-                examples_section.append(separator)
-
-            # Clean up example text
-            example_text = example.strip()
-
+        for example_text in blocks:
             # Create code block with proper formatting
             example_node = nodes.literal_block(example_text, example_text)
             example_node["language"] = "typescript"
@@ -1021,11 +1346,64 @@ class TSAutoDirective(SphinxDirective):
 
         content.append(examples_section)
 
+    def _example_blocks(self, doc_comment: TSDocComment) -> list[str]:
+        """Lay out the examples of a doc comment as code blocks.
+
+        Both the RST and the node rendering use this, so they honour the
+        ``sphinx_ts_multi_block_examples`` option alike.
+
+        Args:
+        ----
+            doc_comment: The doc comment containing examples
+
+        Returns:
+        -------
+            The text of each code block, without blank examples
+
+        """
+        # Clean up example text and skip blank examples
+        examples = [
+            example_text
+            for example in doc_comment.examples
+            if (example_text := example.strip())
+        ]
+        if len(examples) <= 1 or self._use_multi_block_examples(doc_comment):
+            return examples
+
+        # One literal block means one highlighter run for all examples
+        parts = []
+        for number, example in enumerate(examples, start=1):
+            if number > 1:
+                parts.append(_EXAMPLE_SEPARATOR.format(number=number))
+            parts.append(example)
+        return ["".join(parts)]
+
+    def _use_multi_block_examples(
+        self, doc_comment: TSDocComment | None
+    ) -> bool:
+        """Check whether examples should be rendered as separate blocks.
+
+        The layout only differs with several examples, so the configuration
+        is not consulted otherwise.
+
+        Args:
+        ----
+            doc_comment: The doc comment whose examples are rendered
+
+        Returns:
+        -------
+            True if each example gets its own literal block
+
+        """
+        if not doc_comment or len(doc_comment.examples) <= 1:
+            return False
+        return bool(self.config.sphinx_ts_multi_block_examples)
+
     def _register_members_with_domain(
         self,
         parent_name: str,
-        methods: list | None = None,
-        properties: list | None = None,
+        methods: list[TSMethod] | None = None,
+        properties: list[TSProperty] | None = None,
         *,
         noindex: bool = True,
     ) -> None:
@@ -1039,28 +1417,25 @@ class TSAutoDirective(SphinxDirective):
             noindex: Whether to exclude from TOC (default True for members)
 
         """
-        # Register only methods with domain
-        if methods:
-            for method in methods:
-                if hasattr(method, "name") and method.name:
-                    qualified_name = f"{parent_name}.{method.name}"
-                    self._register_object_with_domain(
-                        "method",
-                        qualified_name,
-                        self.env.docname,
-                        noindex=noindex,
-                    )
-
-        if properties:
-            for prop in properties:
-                if hasattr(prop, "name") and prop.name:
-                    qualified_name = f"{parent_name}.{prop.name}"
-                    self._register_object_with_domain(
-                        "property",
+        docname = sys.intern(self.env.docname)
+
+        # Collect the entries and write them with a single update, interned
+        # like in _register_object_with_domain
+        entries = {}
+        for obj_type, members in (
+            ("method", methods),
+            ("property", properties),
+        ):
+            for member in members or ():
+                if member.name:
+                    qualified_name = sys.intern(f"{parent_name}.{member.name}")
+                    entries[obj_type, qualified_name] = (
+                        docname,
                         qualified_name,
-                        self.env.docname,
-                        noindex=noindex,
+                        noindex,
                     )
+        ts_domain = cast("TypeScriptDomain", self.env.get_domain("ts"))
+        ts_domain.add_objects(docname, entries)
 
     def _create_standard_desc_node(
         self,
@@ -1084,16 +1459,21 @@ class TSAutoDirective(SphinxDirective):
             customization
 
         """
-        qualified_name = f"{parent_name}.{name}" if parent_name else name
+        qualified_name = sys.intern(
+            f"{parent_name}.{name}" if parent_name else name
+        )
+        prefix = _ID_PREFIXES.get(objtype) or f"{objtype}-"
+        node_id = sys.intern(prefix + qualified_name)
 
-        # Create the main desc node
+        # Create the main desc node; the anchor id lives on the signature only
         desc = addnodes.desc(domain="ts", objtype=objtype)
-        desc["ids"] = [f"{objtype}-{qualified_name}"]
 
         # Create signature
         sig = addnodes.desc_signature("", "", first=True)
-        sig["class"] = f"sig-object ts ts-{objtype}"
-        sig["ids"] = [f"{objtype}-{qualified_name}"]
+        sig["class"] = (
+            _SIG_CLASSES.get(objtype) or f"sig-object ts ts-{objtype}"
+        )
+        sig["ids"] = [node_id]
         sig["fullname"] = qualified_name
         desc += sig
 
@@ -1123,47 +1503,258 @@ class TSAutoDirective(SphinxDirective):
             skip_examples: Whether to skip example documentation
 
         """
-        if not doc_comment:
+        if not self._has_doc_content(
+            doc_comment,
+            skip_params=skip_params,
+            skip_returns=skip_returns,
+            skip_examples=skip_examples,
+        ):
             return
 
+        # Format the doc comment as RST and parse it into proper nodes
+        formatted_rst_lines = self.format_doc_comment(
+            doc_comment,
+            skip_params=skip_params,
+            skip_returns=skip_returns,
+            skip_examples=skip_examples,
+        )
+
+        plain_nodes = self._plain_rst_nodes(formatted_rst_lines)
+        if plain_nodes is not None:
+            # Nothing to parse: build the paragraphs directly
+            content_node.extend(plain_nodes)
+            return
+
+        # Identical doc comments (overloads, re-documented members) produce
+        # identical RST, so reuse the parsed tree if we can
+        key = self._rst_cache_key(
+            formatted_rst_lines, (skip_params, skip_returns, skip_examples)
+        )
+        node = self._rst_node_cache.get(key)
+        if node is not None:
+            content_node.extend(node.children)
+            return
+
+        # Use Sphinx's content parsing mechanism, parsing straight into the
+        # target node after any content it already has
+        start = len(content_node)
+        content = StringList(formatted_rst_lines)
         try:
-            # Format the doc comment as RST and parse it into proper nodes
+            self.state.nested_parse(content, self.content_offset, content_node)
+        except (SystemMessage, AssertionError) as e:
+            # Fallback to plain text if RST parsing fails
+            logger.warning("Failed to parse RST content: %s", e)
+            del content_node[start:]
+            if doc_comment is not None and doc_comment.description:
+                desc_para = nodes.paragraph()
+                desc_para.append(nodes.Text(doc_comment.description))
+                content_node.append(desc_para)
+            return
+        parsed = content_node[start:]
+        if _is_replayable(parsed):
+            self._rst_node_cache.put_children(key, parsed)
+
+    def _rst_cache_key(
+        self, lines: list[str], flags: tuple[bool, bool, bool]
+    ) -> tuple[Any, ...]:
+        """Build the parsed doc comment cache key for formatted RST lines.
+
+        Parsed trees hold document-specific state, such as the ``refdoc`` of
+        cross-references, so they are only reused within one document.
+
+        Args:
+        ----
+            lines: The formatted RST lines
+            flags: The skip_params, skip_returns and skip_examples flags
+
+        Returns:
+        -------
+            The cache key
+
+        """
+        return (self.env.docname, tuple(lines), *flags)
+
+    def _has_doc_content(
+        self,
+        doc_comment: TSDocComment | None,
+        *,
+        skip_params: bool,
+        skip_returns: bool,
+        skip_examples: bool,
+    ) -> bool:
+        """Check whether a doc comment renders anything with these flags.
+
+        Params-only comments on constants are common and would otherwise be
+        formatted just to produce no lines.
+
+        Args:
+        ----
+            doc_comment: The doc comment to check
+            skip_params: Whether parameter documentation is skipped
+            skip_returns: Whether return documentation is skipped
+            skip_examples: Whether example documentation is skipped
+
+        Returns:
+        -------
+            True if at least one rendered section is present
+
+        """
+        if not doc_comment:
+            return False
+        return bool(
+            doc_comment.description
+            or doc_comment.deprecated
+            or doc_comment.since
+            or doc_comment.tags
+            or (doc_comment.params and not skip_params)
+            or (doc_comment.returns and not skip_returns)
+            or (doc_comment.examples and not skip_examples)
+        )
+
+    def _plain_rst_nodes(self, lines: list[str]) -> list[nodes.Node] | None:
+        """Build paragraphs for RST lines that contain no markup at all.
+
+        Most doc comments are a few sentences of prose. Running those through
+        ``nested_parse`` only to get paragraphs back is wasted work, so plain
+        text is turned into paragraph nodes directly.
+
+        Args:
+        ----
+            lines: Formatted RST lines
+
+        Returns:
+        -------
+            The paragraph nodes, or None if the lines need a real parse
+
+        """
+        if any(_RST_MARKUP_RE.search(line) for line in lines):
+            return None
+
+        paragraphs: list[nodes.Node] = []
+        block: list[str] = []
+        for line in [*lines, ""]:
+            if line:
+                block.append(line)
+            elif block:
+                text = "\n".join(block)
+                paragraphs.append(nodes.paragraph(text, text))
+                block = []
+        return paragraphs
+
+    def _add_standard_doc_content_batch(
+        self,
+        targets: Sequence[tuple[addnodes.desc_content, TSDocComment | None]],
+        *,
+        skip_params: bool = False,
+        skip_returns: bool = False,
+        skip_examples: bool = False,
+    ) -> None:
+        """Add documentation content for several objects with one RST parse.
+
+        Each doc comment that is not already cached is wrapped in its own
+        ``container`` directive, the whole batch is parsed once and the
+        resulting containers are routed back to their content nodes.
+
+        Args:
+        ----
+            targets: Pairs of content node and the doc comment to add to it
+            skip_params: Whether to skip parameter documentation
+            skip_returns: Whether to skip return documentation
+            skip_examples: Whether to skip example documentation
+
+        """
+        flags = (skip_params, skip_returns, skip_examples)
+        rst_cache = self._rst_node_cache
+        pending = []
+        for content_node, doc_comment in targets:
+            if not self._has_doc_content(
+                doc_comment,
+                skip_params=skip_params,
+                skip_returns=skip_returns,
+                skip_examples=skip_examples,
+            ):
+                continue
             formatted_rst_lines = self.format_doc_comment(
                 doc_comment,
                 skip_params=skip_params,
                 skip_returns=skip_returns,
                 skip_examples=skip_examples,
             )
+            if not any(line.strip() for line in formatted_rst_lines):
+                continue
+            plain_nodes = self._plain_rst_nodes(formatted_rst_lines)
+            if plain_nodes is not None:
+                content_node.extend(plain_nodes)
+                continue
+            key = self._rst_cache_key(formatted_rst_lines, flags)
+            node = rst_cache.get(key)
+            if node is not None:
+                content_node.extend(node.children)
+                continue
+            pending.append(
+                (content_node, doc_comment, formatted_rst_lines, key)
+            )
 
-            if formatted_rst_lines:
-                # Use Sphinx's content parsing mechanism
-                content = StringList(formatted_rst_lines)
-                node = nodes.Element()
-                self.state.nested_parse(content, self.content_offset, node)
-
-                # Add the parsed content
-                for child in node.children:
-                    content_node.append(child)
+        if len(pending) > 1:
+            # Collected as a plain list: handing it to StringList in one go
+            # is cheaper than appending line by line to a ViewList
+            batch_lines = []
+            append = batch_lines.append
+            for index, (_, _, lines, _) in enumerate(pending):
+                append(f".. container:: ts-batch-{index}")
+                append("")
+                batch_lines.extend(
+                    f"   {line}" if line else "" for line in lines
+                )
+                append("")
 
-        except Exception as e:
-            # Fallback to plain text if RST parsing fails
-            logger.warning(
-                "Failed to parse RST content: %s",
-                e,
+            try:
+                node = nodes.Element()
+                self.state.nested_parse(
+                    StringList(batch_lines), self.content_offset, node
+                )
+            except (SystemMessage, AssertionError) as e:
+                logger.debug("Batched RST parse failed: %s", e)
+            else:
+                # Only containers, one per pending doc comment, in order
+                containers = [
+                    child
+                    for child in node.children
+                    if isinstance(child, nodes.container)
+                ]
+                split_back = len(containers) == len(node.children) and all(
+                    container["classes"] == [f"ts-batch-{index}"]
+                    for index, container in enumerate(containers)
+                )
+                if split_back and len(containers) == len(pending):
+                    for (content_node, _, _, key), container in zip(
+                        pending, containers, strict=True
+                    ):
+                        if _is_replayable([container]):
+                            rst_cache.put(key, container)
+                        content_node.extend(container.children)
+                    return
+
+        # Single doc comment, or the batch could not be split back apart
+        for content_node, doc_comment, _, _ in pending:
+            self._add_standard_doc_content(
+                content_node,
+                doc_comment,
+                skip_params=skip_params,
+                skip_returns=skip_returns,
+                skip_examples=skip_examples,
             )
-            if doc_comment and doc_comment.description:
-                desc_para = nodes.paragraph()
-                desc_para.append(nodes.Text(doc_comment.description))
-                content_node.append(desc_para)
 
     def _create_standard_signature(
         self,
         sig_node: addnodes.desc_signature,
         name: str,
         annotation: str = "",
+        *,
         type_params: list[str] | None = None,
         extends: list[str] | None = None,
-        modifiers: list[str] | None = None,
+        modifiers: Sequence[str] | None = None,
+        suffix: str = "",
     ) -> None:
         """Create a standardized signature with consistent formatting.
 
@@ -1175,28 +1766,58 @@ class TSAutoDirective(SphinxDirective):
             type_params: Optional type parameters
             extends: Optional extends clauses
             modifiers: Optional modifiers (export, declare, etc.)
+            suffix: Optional trailing text, such as a type annotation
 
         """
+        # Collect the children locally and attach them in one go
+        children: list[nodes.Node] = []
+
         # Add modifiers first
         if modifiers:
-            for modifier in modifiers:
-                sig_node += addnodes.desc_annotation(
-                    f"{modifier} ", f"{modifier} "
-                )
+            children.extend(
+                _signature_annotation(modifier) for modifier in modifiers
+            )
 
         # Add annotation (class, interface, etc.)
         if annotation:
-            sig_node += addnodes.desc_annotation(
-                f"{annotation} ", f"{annotation} "
-            )
+            children.append(_signature_annotation(annotation))
 
         # Add main name (use desc_name for main object declarations)
-        sig_node += addnodes.desc_name("", name)
+        children.append(addnodes.desc_name("", name))
 
         # Add type parameters
         if type_params:
-            sig_node += nodes.Text(f"<{', '.join(type_params)}>")
-
-        # Add extends clause
+            children.append(addnodes.desc_sig_punctuation("", "<"))
+            for index, type_param in enumerate(type_params):
+                if index:
+                    children.append(addnodes.desc_sig_punctuation("", ", "))
+                children.append(addnodes.desc_sig_name("", type_param))
+            children.append(addnodes.desc_sig_punctuation("", ">"))
+
+        # Add extends clause, linking each base type to its documentation
         if extends:
-            sig_node += nodes.Text(f" extends {', '.join(extends)}")
+            children.extend(
+                [
+                    addnodes.desc_sig_space(),
+                    addnodes.desc_sig_keyword("", "extends"),
+                    addnodes.desc_sig_space(),
+                ]
+            )
+            for index, base in enumerate(extends):
+                if index:
+                    children.append(addnodes.desc_sig_punctuation("", ", "))
+                children.append(
+                    addnodes.pending_xref(
+                        "",
+                        nodes.Text(base),
+                        refdomain="ts",
+                        reftype="obj",
+                        reftarget=base.split("<", 1)[0].strip(),
+                    )
+                )
+
+        # Add trailing text (type annotation, type alias definition)
+        if suffix:
+            children.append(nodes.Text(suffix))
+
+        sig_node.extend(children)
@@ -7,17 +7,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sphinx.util import logging
-
 from .base import TSAutoDirective
 
 if TYPE_CHECKING:
     from docutils import nodes
+    from sphinx import addnodes
 
     from sphinx_ts.parser import TSClass
 
-logger = logging.getLogger(__name__)
-
 
 class TSAutoClassDirective(TSAutoDirective):
     """Auto-documentation directive for TypeScript classes."""
@@ -57,26 +54,26 @@ class TSAutoClassDirective(TSAutoDirective):
         # Add standardized documentation content
         self._add_standard_doc_content(class_content, ts_class.doc_comment)
 
-        # Add constructor if present
+        # Format all members in a single ordered pass: constructor first,
+        # then properties, then methods
+        members: list[addnodes.desc | None] = []
         if ts_class.constructor:
-            constructor_desc = self._format_method_common(
-                ts_class.constructor, class_name, "Constructor"
+            members.append(
+                self._format_method_common(
+                    ts_class.constructor, class_name, "Constructor"
+                )
             )
-            if constructor_desc:
-                class_content.append(constructor_desc)
-
-        # Add properties directly to class content (after constructor)
-        if ts_class.properties:
-            for prop in ts_class.properties:
-                prop_desc = self._format_property_common(prop, class_name)
-                if prop_desc:
-                    class_content.append(prop_desc)
-
-        # Add methods directly to class content (after properties)
-        if ts_class.methods:
-            for method in ts_class.methods:
-                method_desc = self._format_method_common(method, class_name)
-                if method_desc:
-                    class_content.append(method_desc)
+        members.extend(
+            self._format_property_common(prop, class_name)
+            for prop in ts_class.properties
+        )
+        members.extend(
+            self._format_method_common(method, class_name)
+            for method in ts_class.methods
+        )
+
+        class_content.extend(
+            [member_desc for member_desc in members if member_desc]
+        )
 
         return [class_desc]
@@ -6,8 +6,7 @@ variables, constants, and functions.
 
 from __future__ import annotations
 
-import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from docutils import nodes
 from sphinx import addnodes
@@ -18,10 +17,39 @@ from sphinx_ts.parser import TSValueParser
 from .base import TSAutoDirective
 
 if TYPE_CHECKING:
-    from sphinx_ts.parser import TSVariable
+    from sphinx_ts.parser import TSMethod, TSVariable
 
 logger = sphinx_logging.getLogger(__name__)
 
+# Object types autodata documents, in lookup order
+_AUTODATA_OBJTYPES = ("variable", "function", "type")
+
+# Column widths and header labels of the variable value table
+_VALUE_TABLE_COLUMNS = (
+    (15, "Field"),
+    (15, "Type"),
+    (25, "Value"),
+    (45, "Description"),
+)
+
+# Parsed value types whose table cell is shown as a formatted code block
+_COMPLEX_TYPES = frozenset(("object", "array"))
+
+
+def _make_value_table_tgroup() -> nodes.tgroup:
+    """Build the column specs and header row shared by all value tables.
+
+    Constructing the nodes directly is cheaper than deep-copying a
+    prebuilt template.
+    """
+    tgroup = nodes.tgroup(cols=len(_VALUE_TABLE_COLUMNS))
+    header_row = nodes.row()
+    for colwidth, label in _VALUE_TABLE_COLUMNS:
+        tgroup += nodes.colspec(colwidth=colwidth)
+        header_row += nodes.entry("", nodes.paragraph(text=label))
+    tgroup += nodes.thead("", header_row)
+    return tgroup
+
 
 class TSAutoDataDirective(TSAutoDirective):
     """Auto-documentation directive for TypeScript variables/constants."""
@@ -30,36 +58,12 @@ class TSAutoDataDirective(TSAutoDirective):
         """Run the variable auto-documentation directive."""
         variable_name = self.arguments[0]
 
-        # Find and register the variable using common processing pattern
-        # Use debug level for initial variable lookup since we have fallbacks
-        result = self._process_object_common(
-            variable_name, "variable", log_level=logging.DEBUG
+        # Look the name up as a variable, then a function, then a type
+        # alias, only scanning for the kinds it is actually declared as
+        object_type, result = self._process_object_any(
+            variable_name, _AUTODATA_OBJTYPES
         )
-        if result:
-            logger.debug("Found '%s' as variable", variable_name)
-        else:
-            logger.debug(
-                "Variable '%s' not found, trying as function", variable_name
-            )
-
-        # If not found as a variable, try to find it as a function
-        if not result:
-            function_result = self._process_object_common(
-                variable_name, "function"
-            )
-            if function_result:
-                logger.debug("Found '%s' as function", variable_name)
-                return self._process_function(function_result, variable_name)
-
-            logger.debug(
-                "Function '%s' not found, trying as type alias", variable_name
-            )
-            # If not found as a function, try to find it as a type alias
-            type_result = self._process_object_common(variable_name, "type")
-            if type_result:
-                logger.debug("Found '%s' as type alias", variable_name)
-                return self._process_type_alias(type_result, variable_name)
-
+        if result is None:
             logger.warning(
                 "Could not find TypeScript object '%s' as variable, function, "
                 "or type",
@@ -67,6 +71,12 @@ class TSAutoDataDirective(TSAutoDirective):
             )
             return []
 
+        logger.debug("Found '%s' as %s", variable_name, object_type)
+        if object_type == "function":
+            return self._process_function(result, variable_name)
+        if object_type == "type":
+            return self._process_type_alias(result, variable_name)
+
         ts_variable: TSVariable = result["object"]
         file_path = result["file_path"]
 
@@ -75,18 +85,15 @@ class TSAutoDataDirective(TSAutoDirective):
             "variable", variable_name
         )
 
-        # Create variable signature with type annotation
-        modifiers = [ts_variable.kind] if hasattr(ts_variable, "kind") else []
+        # Create variable signature with type annotation, if present
         self._create_standard_signature(
-            var_sig, variable_name, modifiers=modifiers
-        )
-
-        # Add type annotation if present
-        if ts_variable.type_annotation:
-            formatted_type = self.format_parameter_type(
+            var_sig,
+            variable_name,
+            modifiers=(ts_variable.kind,) if ts_variable.kind else None,
+            suffix=self.format_parameter_type(
                 ts_variable.type_annotation, add_colon=True
-            )
-            var_sig += nodes.Text(formatted_type)
+            ),
+        )
 
         # Add standardized documentation content (skip params for now, handle
         # separately)
@@ -101,151 +108,156 @@ class TSAutoDataDirective(TSAutoDirective):
         # Add value information if available
         if ts_variable.value:
             # Create a value section within the content
-            value_title = nodes.paragraph()
-            value_title += nodes.strong(text="Value:")
-            var_content.append(value_title)
+            var_content.append(
+                nodes.paragraph("", "", nodes.strong("", "Value:"))
+            )
 
-            # Parse the value to determine how to display it
-            value_data = TSValueParser.parse_value(ts_variable.value)
+            # Parse the value to determine how to display it, formatting it
+            # from the same parse in case it is shown as code
+            value_data, formatted_value = TSValueParser.parse_and_format(
+                ts_variable.value
+            )
+            is_complex = self._is_complex_const(ts_variable, value_data)
 
             # For const values with complex properties, use a code block
-            if (
-                hasattr(ts_variable, "kind")
-                and ts_variable.kind == "const"
-                and (
-                    value_data["type"] == "object"
-                    or value_data["type"].endswith("[]")
-                    or "{" in ts_variable.value
-                )
-            ):
-                # Add a prefix to show this is a constant declaration
-                declaration = f"const {ts_variable.name} = "
-
-                # Format the value with proper syntax highlighting
-                formatted_value = TSValueParser.format_value(ts_variable.value)
-
-                # Combine the declaration and value
-                full_code = f"{declaration}{formatted_value};"
+            if is_complex:
+                # Prefix the formatted value with its const declaration,
+                # built in one pass as the value can be large
+                full_code = f"const {ts_variable.name} = {formatted_value};"
 
                 code_block = nodes.literal_block(text=full_code)
                 code_block["language"] = "typescript"
                 code_block["classes"] = ["highlight"]
                 var_content.append(code_block)
 
-                # Add property descriptions after the code block if available
-                if ts_variable.doc_comment and ts_variable.doc_comment.params:
+                # Add property descriptions after the code block if available,
+                # sorted alphabetically for easier reference. The title is
+                # only added when at least one property has a description.
+                doc_comment = ts_variable.doc_comment
+                described_props = (
+                    [prop for prop in doc_comment.sorted_params if prop[1]]
+                    if doc_comment and doc_comment.params
+                    else []
+                )
+                if described_props:
                     props_title = nodes.paragraph()
                     props_title += nodes.strong(text="Property Descriptions:")
                     var_content.append(props_title)
 
                     # Create a definition list for properties
-                    prop_list = nodes.definition_list()
-                    prop_list["classes"] = ["ts-property-descriptions"]
-
-                    # Sort properties alphabetically for easier reference
-                    sorted_props = sorted(
-                        ts_variable.doc_comment.params.items()
+                    prop_list = nodes.definition_list(
+                        classes=["ts-property-descriptions"]
                     )
-
-                    for prop_name, prop_desc in sorted_props:
-                        if prop_desc:
-                            term_item = nodes.term()
-                            term_item += nodes.literal(text=prop_name)
-
-                            def_item = nodes.definition()
-                            def_item += nodes.paragraph(text=prop_desc)
-
-                            list_item = nodes.definition_list_item()
-                            list_item += term_item
-                            list_item += def_item
-                            prop_list += list_item
-
-                    if len(prop_list.children) > 0:
-                        var_content.append(prop_list)
+                    for prop_name, prop_desc in described_props:
+                        prop_list += nodes.definition_list_item(
+                            "",
+                            nodes.term("", "", nodes.literal("", prop_name)),
+                            nodes.definition(
+                                "", nodes.paragraph("", prop_desc)
+                            ),
+                        )
+                    var_content.append(prop_list)
             else:
                 # Use table for simpler values
-                value_table = self._create_value_table(ts_variable)
+                value_table = self._create_value_table(
+                    ts_variable, value_data, is_complex=is_complex
+                )
                 if value_table:
                     var_content.append(value_table)
                 else:
                     # Fallback to simple display if table creation fails
-                    value_para = nodes.paragraph()
-                    value_code = nodes.literal(text=ts_variable.value)
-                    value_para += value_code
-                    var_content.append(value_para)
+                    var_content.append(
+                        nodes.paragraph(
+                            "", "", nodes.literal("", ts_variable.value)
+                        )
+                    )
 
         return [var_node]
 
+    def _is_complex_const(
+        self, ts_variable: TSVariable, value_data: dict[str, Any]
+    ) -> bool:
+        """Check whether a variable is a const best shown as a code block.
+
+        Args:
+        ----
+            ts_variable: The variable to check
+            value_data: The parsed value of the variable
+
+        Returns:
+        -------
+            True for const objects, typed arrays and unrecognised values
+            containing braces
+
+        """
+        if ts_variable.kind != "const":
+            return False
+        if value_data["is_complex"]:
+            return True
+        # Only scan the source for braces when the parser could not classify
+        # the value, e.g. ``Object.freeze({...})``
+        return value_data["type"] == "unknown" and "{" in (
+            ts_variable.value or ""
+        )
+
     def _create_value_table(
-        self, ts_variable: TSVariable
+        self,
+        ts_variable: TSVariable,
+        value_data: dict[str, Any] | None = None,
+        *,
+        is_complex: bool | None = None,
     ) -> nodes.table | None:
-        """Create a table showing the variable value with type info."""
-        # Create a table for the value
-        table = nodes.table(classes=["variable-value-table"])
-        tgroup = nodes.tgroup(cols=4)
-        table += tgroup
+        """Create a table showing the variable value with type info.
 
-        # Add column specs - name/field, type, value, description
-        tgroup.append(nodes.colspec(colwidth=15))
-        tgroup.append(nodes.colspec(colwidth=15))
-        tgroup.append(nodes.colspec(colwidth=25))
-        tgroup.append(nodes.colspec(colwidth=45))
-
-        # Create table header
-        thead = nodes.thead()
-        tgroup += thead
-        header_row = nodes.row()
-        header_row.append(nodes.entry("", nodes.paragraph(text="Field")))
-        header_row.append(nodes.entry("", nodes.paragraph(text="Type")))
-        header_row.append(nodes.entry("", nodes.paragraph(text="Value")))
-        header_row.append(nodes.entry("", nodes.paragraph(text="Description")))
-        thead.append(header_row)
+        Args:
+        ----
+            ts_variable: The variable to describe
+            value_data: The already parsed value, if the caller has it
+            is_complex: The result of ``_is_complex_const``, if already known
 
-        # Create table body
-        tbody = nodes.tbody()
-        tgroup += tbody
-
-        # Get documentation for fields from JSDoc comments
-        if ts_variable.doc_comment and ts_variable.doc_comment.params:
-            pass  # field_docs would be assigned here but not currently used
+        Returns:
+        -------
+            The value table, or None if the value is better shown as code
 
+        """
         # If value is None, return None
         if ts_variable.value is None:
             return None
 
-        # Use the TSValueParser to parse the value
-        # TSValueParser already imported at top
-
-        value_data = TSValueParser.parse_value(ts_variable.value)
+        # Use the TSValueParser to parse the value unless it already was
+        if value_data is None:
+            value_data = TSValueParser.parse_value(ts_variable.value)
 
-        # Check if it's a const with a complex value - use a code block
-        if ts_variable.kind == "const" and (
-            (value_data["type"] == "object" and value_data["properties"])
-            or value_data["type"].endswith("[]")
-            or "{" in ts_variable.value
-        ):
+        # Check if it's a const with a complex value - use a code block.
+        # Done before building any table nodes so this common case is cheap.
+        if is_complex is None:
+            is_complex = self._is_complex_const(ts_variable, value_data)
+        if is_complex:
             return None
 
+        # Create a table for the value
+        table = nodes.table(classes=["variable-value-table"])
+        tgroup = _make_value_table_tgroup()
+        table += tgroup
+
+        # Create table body
+        tbody = nodes.tbody()
+        tgroup += tbody
+
         # For simple values, create a single row
         value_row = nodes.row()
 
         # Value name cell
-        name_cell = nodes.entry()
-        name_cell += nodes.paragraph(text="(value)")
-        value_row.append(name_cell)
+        value_row.append(nodes.entry("", nodes.paragraph("", "(value)")))
 
         # Value type cell
         type_cell = nodes.entry()
         if ts_variable.type_annotation:
-            type_para = nodes.paragraph()
-            type_para += nodes.literal(
-                text=self.format_type_annotation(ts_variable.type_annotation)
-            )
-            type_cell += type_para
+            type_text = self.format_type_annotation(ts_variable.type_annotation)
+            type_cell += nodes.paragraph("", "", nodes.literal("", type_text))
         elif value_data["type"] != "unknown":
-            type_para = nodes.paragraph()
-            type_para += nodes.literal(text=value_data["type"])
-            type_cell += type_para
+            type_text = value_data["type"]
+            type_cell += nodes.paragraph("", "", nodes.literal("", type_text))
         value_row.append(type_cell)
 
         # Value content cell - the actual value
@@ -253,7 +265,7 @@ class TSAutoDataDirective(TSAutoDirective):
         value_text = ts_variable.value if ts_variable.value is not None else ""
 
         # Format the value appropriately
-        if value_data["type"] in ["object", "array"]:
+        if value_data["type"] in _COMPLEX_TYPES:
             # Format complex values with syntax highlighting
             # TSValueParser already imported at top
 
@@ -263,19 +275,17 @@ class TSAutoDataDirective(TSAutoDirective):
             code_block["classes"] = ["highlight"]
             content_cell += code_block
         else:
-            content_para = nodes.paragraph()
-            content_para += nodes.literal(text=value_text)
-            content_cell += content_para
+            content_cell += nodes.paragraph(
+                "", "", nodes.literal("", value_text)
+            )
 
         value_row.append(content_cell)
 
         # Value description cell
         desc_cell = nodes.entry()
         if ts_variable.doc_comment and ts_variable.doc_comment.description:
-            desc_para = nodes.paragraph()
             desc_text = str(ts_variable.doc_comment.description or "")
-            desc_para += nodes.Text(desc_text)
-            desc_cell += desc_para
+            desc_cell += nodes.paragraph("", desc_text)
         value_row.append(desc_cell)
 
         tbody.append(value_row)
@@ -283,10 +293,10 @@ class TSAutoDataDirective(TSAutoDirective):
         return table
 
     def _process_function(
-        self, result: dict, function_name: str
+        self, result: dict[str, Any], function_name: str
     ) -> list[nodes.Node]:
         """Process a TypeScript function."""
-        ts_function = result["object"]
+        ts_function: TSMethod = result["object"]
         file_path = result["file_path"]
 
         # Create standardized function descriptor
@@ -305,13 +315,12 @@ class TSAutoDataDirective(TSAutoDirective):
         func_sig += paramlist
 
         # Add parameters to signature
-        if ts_function.parameters:
-            for param in ts_function.parameters:
-                parameter = addnodes.desc_parameter("", "")
-                paramlist += parameter
+        for param in ts_function.parameters:
+            parameter = addnodes.desc_parameter("", "")
+            paramlist += parameter
 
-                # Use the shared parameter formatting helper
-                self.format_parameter_nodes(parameter, param)
+            # Use the shared parameter formatting helper
+            self.format_parameter_nodes(parameter, param)
 
         # Add return type
         if ts_function.return_type:
@@ -340,10 +349,10 @@ class TSAutoDataDirective(TSAutoDirective):
         return [func_node]
 
     def _process_type_alias(
-        self, result: dict, type_alias_name: str
+        self, result: dict[str, Any], type_alias_name: str
     ) -> list[nodes.Node]:
         """Process a TypeScript type alias."""
-        type_alias = result["object"]
+        type_alias: dict[str, Any] = result["object"]
         file_path = result["file_path"]
 
         # Create standardized type alias descriptor
@@ -351,20 +360,18 @@ class TSAutoDataDirective(TSAutoDirective):
             "type", type_alias_name
         )
 
-        # Create type alias signature
+        # Create type alias signature, including the type definition
+        type_def = type_alias.get("type_definition", "")
         self._create_standard_signature(
             type_sig,
             type_alias_name,
             "type",
             type_params=type_alias.get("type_parameters"),
+            suffix=f" = {self.format_type_annotation(type_def)}"
+            if type_def
+            else "",
         )
 
-        # Add type definition
-        type_def = type_alias.get("type_definition", "")
-        if type_def:
-            formatted_type_def = self.format_type_annotation(type_def)
-            type_sig += nodes.Text(f" = {formatted_type_def}")
-
         # Add inline source link to signature
         self._add_source_link_to_signature(type_sig, file_path, type_alias)
 
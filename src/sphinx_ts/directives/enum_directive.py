@@ -5,18 +5,28 @@ Contains the TSAutoEnumDirective class for auto-documenting TypeScript enums.
 
 from __future__ import annotations
 
+from itertools import product
 from typing import TYPE_CHECKING
 
 from docutils import nodes
 from sphinx import addnodes
-from sphinx.util import logging
 
 from .base import TSAutoDirective
 
 if TYPE_CHECKING:
-    from sphinx_ts.parser import TSEnum, TSEnumMember
-
-logger = logging.getLogger(__name__)
+    from sphinx_ts.parser import TSDocComment, TSEnum, TSEnumMember
+
+# Signature modifiers for each (is_export, is_declare, is_const) combination
+_ENUM_MODIFIERS = {
+    flags: tuple(
+        keyword
+        for keyword, flag in zip(
+            ("export", "declare", "const"), flags, strict=True
+        )
+        if flag
+    )
+    for flags in product((False, True), repeat=3)
+}
 
 
 class TSAutoEnumDirective(TSAutoDirective):
@@ -69,16 +79,10 @@ class TSAutoEnumDirective(TSAutoDirective):
             "enum", ts_enum.name
         )
 
-        # Collect modifiers
-        modifiers = []
-        if ts_enum.is_export:
-            modifiers.append("export")
-        if ts_enum.is_declare:
-            modifiers.append("declare")
-        if ts_enum.is_const:
-            modifiers.append("const")
-
         # Create standardized signature with modifiers
+        modifiers = _ENUM_MODIFIERS[
+            ts_enum.is_export, ts_enum.is_declare, ts_enum.is_const
+        ]
         self._create_standard_signature(
             sig_node, ts_enum.name, "enum", modifiers=modifiers
         )
@@ -121,22 +125,46 @@ class TSAutoEnumDirective(TSAutoDirective):
         members_section["ids"] = [f"enum-{ts_enum.name}-members"]
 
         # Create members title
-        title = nodes.title()
-        title += nodes.Text("Members")
-        members_section += title
+        members_section += nodes.title("", "Members")
 
-        # Add each member as individual documentation
+        # Add each member as individual documentation; the member docs are
+        # parsed together once all signatures are built
+        doc_targets: list[
+            tuple[addnodes.desc_content, TSDocComment | None]
+        ] = []
         for member in ts_enum.members:
-            member_nodes = self._format_enum_member(member, ts_enum.name)
-            for member_node in member_nodes:
-                members_section += member_node
+            members_section.extend(
+                self._format_enum_member(
+                    member, ts_enum.name, doc_targets=doc_targets
+                )
+            )
+
+        self._add_standard_doc_content_batch(doc_targets, skip_examples=True)
 
         content_nodes.append(members_section)
 
     def _format_enum_member(
-        self, member: TSEnumMember, enum_name: str
+        self,
+        member: TSEnumMember,
+        enum_name: str,
+        *,
+        doc_targets: list[tuple[addnodes.desc_content, TSDocComment | None]]
+        | None = None,
     ) -> list[nodes.Node]:
-        """Format an enum member."""
+        """Format an enum member.
+
+        Args:
+        ----
+            member: The enum member to format
+            enum_name: The name of the parent enum
+            doc_targets: If given, the member documentation is queued here
+                for a batched parse instead of being parsed immediately
+
+        Returns:
+        -------
+            The nodes documenting the member
+
+        """
         member_nodes = []
 
         # Create standardized enum member descriptor
@@ -159,14 +187,17 @@ class TSAutoEnumDirective(TSAutoDirective):
         # Add standardized documentation content, but skip complex directives
         # that might cause issues in enum member contexts
         if member.doc_comment and member.doc_comment.description:
-            self._add_standard_doc_content(
-                desc_content, member.doc_comment, skip_examples=True
-            )
+            if doc_targets is not None:
+                doc_targets.append((desc_content, member.doc_comment))
+            else:
+                self._add_standard_doc_content(
+                    desc_content, member.doc_comment, skip_examples=True
+                )
         else:
             # Add a simple note if no documentation is available
-            para = nodes.paragraph()
-            para += nodes.emphasis(text="No description available.")
-            desc_content += para
+            desc_content += nodes.paragraph(
+                "", "", nodes.emphasis("", "No description available.")
+            )
 
         member_nodes.append(desc_node)
 
@@ -174,9 +205,6 @@ class TSAutoEnumDirective(TSAutoDirective):
 
     def _create_member_signature(self, member: TSEnumMember) -> str:
         """Create the member signature string."""
-        signature = member.name
-
-        if member.value is not None:
-            signature += f" = {member.value}"
-
-        return signature
+        if member.value is None:
+            return member.name
+        return f"{member.name} = {member.value}"
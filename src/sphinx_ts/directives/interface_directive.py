@@ -7,17 +7,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sphinx.util import logging
-
 from .base import TSAutoDirective
 
 if TYPE_CHECKING:
     from docutils import nodes
+    from sphinx import addnodes
 
     from sphinx_ts.parser import TSInterface
 
-logger = logging.getLogger(__name__)
-
 
 class TSAutoInterfaceDirective(TSAutoDirective):
     """Auto-documentation directive for TypeScript interfaces."""
@@ -68,18 +65,20 @@ class TSAutoInterfaceDirective(TSAutoDirective):
             interface_content, ts_interface.doc_comment
         )
 
-        # Add properties directly to interface content (before methods)
-        if ts_interface.properties:
-            for prop in ts_interface.properties:
-                prop_desc = self._format_property_common(prop, interface_name)
-                if prop_desc:
-                    interface_content.append(prop_desc)
-
-        # Add methods directly to interface content (after properties)
-        if ts_interface.methods:
-            for method in ts_interface.methods:
-                method_desc = self._format_method_common(method, interface_name)
-                if method_desc:
-                    interface_content.append(method_desc)
+        # Format all members in a single ordered pass: properties first,
+        # then methods
+        members: list[addnodes.desc | None] = []
+        members.extend(
+            self._format_property_common(prop, interface_name)
+            for prop in ts_interface.properties
+        )
+        members.extend(
+            self._format_method_common(method, interface_name)
+            for method in ts_interface.methods
+        )
+
+        interface_content.extend(
+            [member_desc for member_desc in members if member_desc]
+        )
 
         return [interface_desc]
@@ -5,12 +5,22 @@ Provides a Sphinx domain for TypeScript with roles and object types.
 
 from __future__ import annotations
 
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-from docutils import nodes
 from docutils.nodes import Text, inline
 from docutils.parsers.rst import directives
-from sphinx import addnodes
+from sphinx.addnodes import (
+    desc_annotation,
+    desc_name,
+    desc_parameter,
+    desc_parameterlist,
+    desc_sig_name,
+)
 from sphinx.directives import ObjectDescription
 from sphinx.domains import Domain, ObjType
 from sphinx.locale import _
@@ -23,20 +33,81 @@ from sphinx.util.nodes import make_refnode
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
+    from docutils import nodes
     from docutils.nodes import Node, reference, system_message
     from sphinx.builders import Builder
     from sphinx.environment import BuildEnvironment
 
-# Constants for object data tuple indices
-OBJDATA_DOCNAME_INDEX = 0
-OBJDATA_SYNOPSIS_INDEX = 1
-OBJDATA_NOINDEX_INDEX = 2
+# Length of the (docname, synopsis, noindex) object data tuples
 OBJDATA_TUPLE_LENGTH = 3
 
 logger = logging.getLogger(__name__)
 
-
-def parse_parameters_from_signature(sig: str) -> list[dict[str, str]]:
+# Number of distinct parameter lists and parameters whose parse is memoized
+PARAMETER_CACHE_SIZE = 4096
+
+# Brackets and separators that delimit parameters in a signature
+_PARAM_DELIMITER_RE = re.compile(r"=>|[(){}\[\]<>,]")
+_OPENING_BRACKETS = frozenset("({[<")
+_CLOSING_BRACKETS = frozenset(")}]>")
+
+# Splits a callable signature into its name and the text between the first
+# opening and the last closing parenthesis
+_CALL_SIGNATURE_RE = re.compile(
+    r"(?P<name>[^(]*)(?:\((?P<params>.*)\))?", re.DOTALL
+)
+
+# Separates a parameter from its default value, skipping ``=>`` arrows
+_DEFAULT_SEPARATOR_RE = re.compile(r"=(?!>)")
+
+# Object types of the roles that refer to a single object type
+_ROLE_TO_OBJTYPE = {
+    "class": "class",
+    "interface": "interface",
+    "meth": "method",
+    "prop": "property",
+    "func": "function",
+    "var": "variable",
+}
+
+# Built-in type names repeated across most signatures, interned so every
+# parsed parameter shares one string object per type
+_COMMON_TYPES = frozenset(
+    (
+        "string",
+        "number",
+        "boolean",
+        "any",
+        "void",
+        "unknown",
+        "never",
+        "null",
+        "undefined",
+        "object",
+        "symbol",
+        "bigint",
+    )
+)
+
+# Parameter names up to this length are interned; short names such as
+# ``options`` or ``callback`` recur throughout an API
+_INTERNED_NAME_MAX_LENGTH = 16
+
+# Object types registered under ``Parent.member`` qualified names
+_MEMBER_OBJTYPES = frozenset(("method", "property"))
+
+
+@dataclass(slots=True, frozen=True)
+class SignatureParameter:
+    """A parameter parsed from a TypeScript signature."""
+
+    name: str = ""
+    type: str = ""
+    optional: bool = False
+    default: str = ""
+
+
+def parse_parameters_from_signature(sig: str) -> tuple[SignatureParameter, ...]:
     """Parse parameters from a TypeScript function signature.
 
     Args:
@@ -45,53 +116,82 @@ def parse_parameters_from_signature(sig: str) -> list[dict[str, str]]:
 
     Returns:
     -------
-        List of parameter dictionaries with name, type, optional, default keys
+        The parsed parameters
 
     """
-    parameters = []
+    _, param_str = _split_call_signature(sig)
+    return _split_parameters(param_str)
+
 
-    # Extract parameter list from signature
-    if "(" not in sig:
-        return parameters
+def _split_call_signature(sig: str) -> tuple[str, str]:
+    """Split a callable signature into its name and parameter text.
 
-    start = sig.index("(") + 1
-    end = sig.rfind(")")
-    if end == -1:
-        return parameters
+    Args:
+    ----
+        sig: The signature, such as ``add(a: number, b: number)``
 
-    param_str = sig[start:end].strip()
+    Returns:
+    -------
+        The name and the text between the parentheses, empty if there are
+        none
+
+    """
+    match = _CALL_SIGNATURE_RE.match(sig)
+    if match is None:
+        # Unreachable: every part of the pattern can match an empty string
+        return sig, ""
+    return match.group("name"), match.group("params") or ""
+
+
+@lru_cache(maxsize=PARAMETER_CACHE_SIZE)
+def _split_parameters(param_str: str) -> tuple[SignatureParameter, ...]:
+    """Split a parameter list into parsed parameters.
+
+    Overloads and repeated option-bag signatures recur verbatim, so the
+    parsed parameters are memoized; they are immutable and can be shared.
+
+    Args:
+    ----
+        param_str: The text between the parentheses of a signature
+
+    Returns:
+    -------
+        The parsed parameters
+
+    """
+    parameters = []
+    param_str = param_str.strip()
     if not param_str:
-        return parameters
+        return ()
 
-    # Simple parameter splitting - handles basic cases
-    # This is a simplified parser that handles most common cases
+    # Jump from bracket to bracket, only slicing out parameters at the
+    # commas outside of any brackets. Arrow function types contain ``=>``,
+    # which is matched separately so its ``>`` isn't taken as a bracket.
     depth = 0
-    current_param = ""
-
-    for char in param_str:
-        if char in "({[<":
+    start = 0
+    for match in _PARAM_DELIMITER_RE.finditer(param_str):
+        delimiter = match.group()
+        if delimiter in _OPENING_BRACKETS:
             depth += 1
-        elif char in ")}]>":
+        elif delimiter in _CLOSING_BRACKETS:
             depth -= 1
-        elif char == "," and depth == 0:
+        elif delimiter == "," and depth == 0:
             # End of parameter
-            if current_param.strip():
-                parameters.append(
-                    _parse_single_parameter(current_param.strip())
-                )
-            current_param = ""
-            continue
-
-        current_param += char
+            param = param_str[start : match.start()].strip()
+            if param:
+                parameters.append(_parse_single_parameter(param))
+            start = match.end()
 
     # Add the last parameter
-    if current_param.strip():
-        parameters.append(_parse_single_parameter(current_param.strip()))
+    param = param_str[start:].strip()
+    if param:
+        parameters.append(_parse_single_parameter(param))
 
-    return parameters
+    return tuple(parameters)
 
 
-def _parse_single_parameter(param: str) -> dict[str, str]:
+@lru_cache(maxsize=PARAMETER_CACHE_SIZE)
+def _parse_single_parameter(param: str) -> SignatureParameter:
     """Parse a single parameter string into components.
 
     Args:
@@ -100,26 +200,27 @@ def _parse_single_parameter(param: str) -> dict[str, str]:
 
     Returns:
     -------
-        Dictionary with name, type, optional, default keys
+        The parsed parameter
 
     """
-    result = {"name": "", "type": "", "optional": "false", "default": ""}
-
-    # Handle default values first
-    if "=" in param:
-        param, default = param.rsplit("=", 1)
-        result["default"] = default.strip()
-        param = param.strip()
-
-    # Handle optional parameters
-    if param.endswith("?"):
-        result["optional"] = "true"
-        param = param[:-1].strip()
-
-    # Split name and type
-    if ":" in param:
-        name, type_part = param.split(":", 1)
-        result["name"] = name.strip()
+    default = ""
+    type_str = ""
+
+    # Handle default values first; the first ``=`` that isn't part of an
+    # arrow function type starts the default
+    default_match = _DEFAULT_SEPARATOR_RE.search(param)
+    if default_match:
+        default = param[default_match.end() :].strip()
+        param = param[: default_match.start()].rstrip()
+
+    # Split name and type, marking optional parameters (``name?: type``)
+    name, colon, type_part = param.partition(":")
+    name = name.strip()
+    optional = name.endswith("?")
+    if optional:
+        name = name[:-1].rstrip()
+
+    if colon:
         type_str = type_part.strip()
 
         # Format union types properly (same logic as format_type_annotation)
@@ -137,11 +238,75 @@ def _parse_single_parameter(param: str) -> dict[str, str]:
             # Normalize whitespace for non-union types
             type_str = " ".join(type_str.split())
 
-        result["type"] = type_str
+        if type_str in _COMMON_TYPES:
+            type_str = sys.intern(type_str)
+
+    if len(name) <= _INTERNED_NAME_MAX_LENGTH:
+        name = sys.intern(name)
+
+    return SignatureParameter(name, type_str, optional, default)
+
+
+def _append_name_and_generics(signode: nodes.Element, sig: str) -> None:
+    """Add a declaration name and its generic parameters to a signature.
+
+    Args:
+    ----
+        signode: The signature node to add to
+        sig: The signature, such as ``Repository<T>``
+
+    """
+    name, bracket, generic_part = sig.partition("<")
+    if bracket:
+        generic_part = f"<{generic_part}"
+        signode.append(desc_name(name, name))
+        signode.append(desc_annotation(generic_part, generic_part))
     else:
-        result["name"] = param.strip()
+        signode.append(desc_name(sig, sig))
 
-    return result
+
+def _build_parameter_list(param_str: str) -> desc_parameterlist:
+    """Build the parameter list node of a method or function signature.
+
+    Args:
+    ----
+        param_str: The text between the parentheses of the signature
+
+    Returns:
+    -------
+        The parameter list node
+
+    """
+    param_list = desc_parameterlist()
+    # Bound once, as this runs for every parameter of every signature
+    text = Text
+    sig_name = desc_sig_name
+    parameter = desc_parameter
+
+    for param in _split_parameters(param_str):
+        param_node = parameter()
+        param_type = param.type
+        default = param.default
+
+        # Add parameter name
+        param_node.append(sig_name("", param.name))
+
+        # Add optional marker if needed
+        if param.optional and not default:
+            param_node.append(text("?"))
+
+        # Add type annotation
+        if param_type:
+            param_node.append(text(": "))
+            param_node.append(sig_name("", param_type))
+
+        # Add default value
+        if default:
+            param_node.append(text(f" = {default}"))
+
+        param_list.append(param_node)
+
+    return param_list
 
 
 class TypeScriptObject(ObjectDescription[str]):
@@ -174,8 +339,6 @@ class TypeScriptObject(ObjectDescription[str]):
         noindex: bool = False,
     ) -> None:
         """Add cross-reference target and entry to the general index."""
-        domain = cast("TypeScriptDomain", self.env.get_domain("ts"))
-
         # Add target
         targetname = f"{self.objtype}-{name}"
         if targetname not in self.state.document.ids:
@@ -184,7 +347,9 @@ class TypeScriptObject(ObjectDescription[str]):
             signode["first"] = not self.names
             self.state.document.note_explicit_target(signode)
 
-            # Add to domain's object list
+            # Add to domain's object list; the domain is only looked up for
+            # targets that are actually new
+            domain = cast("TypeScriptDomain", self.env.get_domain("ts"))
             domain.note_object(self.objtype, name, targetname, noindex=noindex)
 
 
@@ -212,17 +377,9 @@ class TSClass(TypeScriptObject):
 
     def handle_signature(self, sig: str, signode: nodes.Element) -> str:
         """Parse the signature and return the class name."""
-        signode.append(addnodes.desc_annotation("class ", "class "))
-
-        # Handle generic parameters
-        if "<" in sig:
-            class_name = sig[: sig.index("<")]
-            generic_part = sig[sig.index("<") :]
-            signode.append(addnodes.desc_name(class_name, class_name))
-            signode.append(addnodes.desc_annotation(generic_part, generic_part))
-        else:
-            signode.append(addnodes.desc_name(sig, sig))
+        signode.append(desc_annotation("class ", "class "))
 
+        _append_name_and_generics(signode, sig)
         return sig
 
 
@@ -248,17 +405,9 @@ class TSInterface(TypeScriptObject):
 
     def handle_signature(self, sig: str, signode: nodes.Element) -> str:
         """Parse the signature and return the interface name."""
-        signode.append(addnodes.desc_annotation("interface ", "interface "))
-
-        # Handle generic parameters
-        if "<" in sig:
-            interface_name = sig[: sig.index("<")]
-            generic_part = sig[sig.index("<") :]
-            signode.append(addnodes.desc_name(interface_name, interface_name))
-            signode.append(addnodes.desc_annotation(generic_part, generic_part))
-        else:
-            signode.append(addnodes.desc_name(sig, sig))
+        signode.append(desc_annotation("interface ", "interface "))
 
+        _append_name_and_generics(signode, sig)
         return sig
 
 
@@ -286,36 +435,10 @@ class TSMethod(TypeScriptObject):
 
     def handle_signature(self, sig: str, signode: nodes.Element) -> str:
         """Parse the signature and return the method name."""
-        method_name = sig[: sig.index("(")] if "(" in sig else sig
-
-        signode.append(addnodes.desc_sig_name(method_name, method_name))
-
-        # Parse and format parameters properly
-        parameters = parse_parameters_from_signature(sig)
-        param_list = addnodes.desc_parameterlist()
-
-        for param in parameters:
-            param_node = addnodes.desc_parameter()
-
-            # Add parameter name
-            param_node.append(addnodes.desc_sig_name("", param["name"]))
-
-            # Add optional marker if needed
-            if param["optional"] == "true" and not param["default"]:
-                param_node.append(nodes.Text("?"))
+        method_name, param_str = _split_call_signature(sig)
 
-            # Add type annotation
-            if param["type"]:
-                param_node.append(nodes.Text(": "))
-                param_node.append(addnodes.desc_sig_name("", param["type"]))
-
-            # Add default value
-            if param["default"]:
-                param_node.append(nodes.Text(f" = {param['default']}"))
-
-            param_list.append(param_node)
-
-        signode.append(param_list)
+        signode.append(desc_sig_name(method_name, method_name))
+        signode.append(_build_parameter_list(param_str))
         return method_name
 
 
@@ -333,16 +456,16 @@ class TSProperty(TypeScriptObject):
     def handle_signature(self, sig: str, signode: nodes.Element) -> str:
         """Parse the signature and return the property name."""
         # Handle type annotation
-        if ":" in sig:
-            prop_name = sig[: sig.index(":")].strip()
-            type_part = sig[sig.index(":") :].strip()
-            signode.append(addnodes.desc_sig_name(prop_name, prop_name))
-            type_annotation = addnodes.desc_annotation(type_part, type_part)
-            signode.append(type_annotation)
-        else:
-            signode.append(addnodes.desc_sig_name(sig, sig))
+        prop_name, colon, type_part = sig.partition(":")
+        if not colon:
+            signode.append(desc_sig_name(sig, sig))
+            return sig
 
-        return sig.split(":")[0].strip() if ":" in sig else sig
+        prop_name = prop_name.strip()
+        type_part = f":{type_part.rstrip()}"
+        signode.append(desc_sig_name(prop_name, prop_name))
+        signode.append(desc_annotation(type_part, type_part))
+        return prop_name
 
 
 class TSFunction(TypeScriptObject):
@@ -373,38 +496,12 @@ class TSFunction(TypeScriptObject):
 
     def handle_signature(self, sig: str, signode: nodes.Element) -> str:
         """Parse the signature and return the function name."""
-        signode.append(addnodes.desc_annotation("function ", "function "))
-
-        func_name = sig[: sig.index("(")] if "(" in sig else sig
-
-        signode.append(addnodes.desc_sig_name(func_name, func_name))
-
-        # Parse and format parameters properly
-        parameters = parse_parameters_from_signature(sig)
-        param_list = addnodes.desc_parameterlist()
-
-        for param in parameters:
-            param_node = addnodes.desc_parameter()
+        signode.append(desc_annotation("function ", "function "))
 
-            # Add parameter name
-            param_node.append(addnodes.desc_sig_name("", param["name"]))
+        func_name, param_str = _split_call_signature(sig)
 
-            # Add optional marker if needed
-            if param["optional"] == "true" and not param["default"]:
-                param_node.append(nodes.Text("?"))
-
-            # Add type annotation
-            if param["type"]:
-                param_node.append(nodes.Text(": "))
-                param_node.append(addnodes.desc_sig_name("", param["type"]))
-
-            # Add default value
-            if param["default"]:
-                param_node.append(nodes.Text(f" = {param['default']}"))
-
-            param_list.append(param_node)
-
-        signode.append(param_list)
+        signode.append(desc_sig_name(func_name, func_name))
+        signode.append(_build_parameter_list(param_str))
         return func_name
 
 
@@ -427,27 +524,20 @@ class TSVariable(TypeScriptObject):
     def handle_signature(self, sig: str, signode: nodes.Element) -> str:
         """Parse the signature and return the variable name."""
         # Handle type annotation and value
-        parts = sig.split("=", 1)
-        name_and_type = parts[0].strip()
-
-        if ":" in name_and_type:
-            var_name = name_and_type[: name_and_type.index(":")].strip()
-            type_part = name_and_type[name_and_type.index(":") :].strip()
-            signode.append(addnodes.desc_name(var_name, var_name))
-            type_annotation = addnodes.desc_annotation(type_part, type_part)
-            signode.append(type_annotation)
-        else:
-            signode.append(addnodes.desc_name(name_and_type, name_and_type))
+        name_and_type, equals, value = sig.partition("=")
+        var_name, colon, type_part = name_and_type.strip().partition(":")
+        var_name = var_name.strip()
 
-        if len(parts) > 1:
-            signode.append(
-                addnodes.desc_annotation(
-                    " = " + parts[1].strip(),
-                    " = " + parts[1].strip(),
-                )
-            )
+        signode.append(desc_name(var_name, var_name))
+        if colon:
+            type_part = f":{type_part.rstrip()}"
+            signode.append(desc_annotation(type_part, type_part))
+
+        if equals:
+            value_part = f" = {value.strip()}"
+            signode.append(desc_annotation(value_part, value_part))
 
-        return sig.split(":")[0].split("=")[0].strip()
+        return var_name
 
 
 class TSXRefRole(XRefRole):
@@ -493,7 +583,7 @@ class TSEnum(TypeScriptObject):
 
     def handle_signature(self, sig: str, signode: nodes.Element) -> str:
         """Parse the signature and return the enum name."""
-        signode.append(addnodes.desc_annotation("enum ", "enum "))
+        signode.append(desc_annotation("enum ", "enum "))
 
         # Handle modifiers (const, declare, export)
         parts = sig.split()
@@ -502,17 +592,34 @@ class TSEnum(TypeScriptObject):
         # Add modifiers
         for part in parts[:-1]:
             if part in ("const", "declare", "export"):
-                signode.append(addnodes.desc_annotation(f"{part} ", f"{part} "))
+                signode.append(desc_annotation(f"{part} ", f"{part} "))
 
-        signode.append(addnodes.desc_name(enum_name, enum_name))
+        signode.append(desc_name(enum_name, enum_name))
         return enum_name
 
 
 class TypeScriptDomain(Domain):
-    """TypeScript domain."""
+    """TypeScript domain.
+
+    The object registry in ``data["objects"]`` is the only state the
+    directives share across documents. It is a flat mapping of
+    ``(obj_type, name)`` to ``(docname, synopsis, noindex)``, so every
+    lookup is a single probe. Each entry records the docname that
+    defined it, which is what ``clear_doc`` and ``merge_domaindata`` key on,
+    so parallel reads under ``sphinx-build -j`` merge back correctly. The
+    ``data["by_doc"]`` index mirrors it, mapping each docname to the keys it
+    registered, so clearing a document only touches its own objects, and
+    ``data["by_name"]`` maps each name to the object types it is registered
+    as, so references to unknown names are rejected with a single probe. All
+    writes go through ``add_objects`` to keep the three in step. The
+    directive-level caches are per-process and never need merging.
+    """
 
     name = "ts"
     label = "TypeScript"
+    # Bumped when the layout of ``data`` changes, so environments pickled
+    # by an older version are rebuilt instead of misread
+    data_version = 3
 
     object_types = {
         "class": ObjType("class", "class", "obj"),
@@ -553,17 +660,42 @@ class TypeScriptDomain(Domain):
 
     initial_data = {
         "objects": {},
+        "by_doc": {},
+        "by_name": {},
     }
 
+    def add_objects(
+        self, docname: str, entries: dict[tuple[str, str], tuple[Any, ...]]
+    ) -> None:
+        """Register objects defined in a document.
+
+        Args:
+        ----
+            docname: The document that defines the objects
+            entries: ``(docname, synopsis, noindex)`` object data keyed by
+                ``(obj_type, name)``
+
+        """
+        self.data["objects"].update(entries)
+        self.data["by_doc"].setdefault(docname, set()).update(entries)
+        by_name = self.data["by_name"]
+        for obj_type, name in entries:
+            by_name.setdefault(name, set()).add(obj_type)
+
     def clear_doc(self, docname: str) -> None:
         """Remove traces of a document in the domain-specific inventories."""
-        for obj_type in self.object_types:
-            if obj_type in self.data["objects"]:
-                self.data["objects"][obj_type] = {
-                    name: obj_data
-                    for name, obj_data in self.data["objects"][obj_type].items()
-                    if obj_data[0] != docname
-                }
+        objects = self.data["objects"]
+        by_name = self.data["by_name"]
+        for key in self.data["by_doc"].pop(docname, ()):
+            # The key may have been registered again by another document
+            obj_data = objects.get(key)
+            if obj_data is not None and obj_data[0] == docname:
+                del objects[key]
+                obj_type, name = key
+                obj_types = by_name[name]
+                obj_types.discard(obj_type)
+                if not obj_types:
+                    del by_name[name]
 
     def merge_domaindata(
         self,
@@ -571,14 +703,80 @@ class TypeScriptDomain(Domain):
         otherdata: dict[str, Any],
     ) -> None:
         """Merge in data regarding docnames from a different domain."""
-        for obj_type in self.object_types:
-            if obj_type in otherdata["objects"]:
-                for name, obj_data in otherdata["objects"][obj_type].items():
-                    fn = obj_data[0]  # First element is always the docname
-                    if fn in docnames:
-                        if obj_type not in self.data["objects"]:
-                            self.data["objects"][obj_type] = {}
-                        self.data["objects"][obj_type][name] = obj_data
+        other_objects = otherdata["objects"]
+        for docname, keys in otherdata["by_doc"].items():
+            if docname not in docnames:
+                continue
+            entries = {}
+            for key in keys:
+                # Skip keys that another document registered again
+                obj_data = other_objects.get(key)
+                if obj_data is not None and obj_data[0] == docname:
+                    # Entries without a noindex flag are indexed, stored in
+                    # full so readers never need to check the length
+                    if len(obj_data) < OBJDATA_TUPLE_LENGTH:
+                        obj_data = (*obj_data, False)
+                    entries[key] = obj_data
+            self.add_objects(docname, entries)
+
+    def _find_object(
+        self, obj_type: str | None, target: str
+    ) -> tuple[Any, ...] | None:
+        """Look up the registered data of an object.
+
+        Args:
+        ----
+            obj_type: The type of object, or None for an unknown role
+            target: The (possibly qualified) name of the object
+
+        Returns:
+        -------
+            The object data tuple, or None if no such object is registered
+
+        """
+        return self.data["objects"].get((obj_type, target))
+
+    def _make_ref(
+        self,
+        builder: Builder,
+        fromdocname: str,
+        obj_type: str | None,
+        target: str,
+        contnode: nodes.Element,
+    ) -> reference | None:
+        """Build a reference node to a registered object.
+
+        Args:
+        ----
+            builder: The active builder
+            fromdocname: The document the reference is in
+            obj_type: The type of object to refer to, or None for an unknown
+                role
+            target: The (possibly qualified) name of the object
+            contnode: The content node of the reference
+
+        Returns:
+        -------
+            The reference node, or None if no such object is registered
+
+        """
+        obj_data = self._find_object(obj_type, target)
+        if obj_data is None:
+            return None
+
+        # Qualified members keep their full name in the ID but are titled
+        # by the member name alone
+        display_text = target
+        if obj_type in _MEMBER_OBJTYPES:
+            display_text = target.rpartition(".")[2]
+        return make_refnode(
+            builder,
+            fromdocname,
+            obj_data[0],
+            f"{obj_type}-{target}",
+            contnode,
+            display_text,
+        )
 
     def resolve_xref(
         self,
@@ -591,121 +789,33 @@ class TypeScriptDomain(Domain):
         contnode: nodes.Element,
     ) -> reference | None:
         """Resolve cross-references."""
-        logger = logging.getLogger(__name__)
         logger.debug("Resolving TypeScript xref: %s:%s", typ, target)
 
-        # Handle method and property references with class/interface prefix
-        # such as Class.method
-        if "." in target and (typ in ["meth", "prop", "method", "property"]):
-            # First check if the qualified name exists directly
-            role_to_objtype = {
-                "meth": "method",
-                "prop": "property",
-                "method": "method",
-                "property": "property",
-            }
-            obj_type = role_to_objtype.get(typ)
-
-            if (
-                obj_type
-                and obj_type in self.data["objects"]
-                and target in self.data["objects"][obj_type]
-            ):
-                obj_data = self.data["objects"][obj_type][target]
-                docname = obj_data[0]
-                return make_refnode(
-                    builder,
-                    fromdocname,
-                    docname,
-                    f"{obj_type}-{target}",
-                    contnode,
-                    target,
-                )
+        registered_types = self.data["by_name"].get(target)
+        if not registered_types:
+            logger.debug("TypeScript xref not found: %s:%s", typ, target)
+            return None
 
-        # Map role to object type
         if typ == "obj":
-            # Search in all object types
-            for obj_type in self.object_types:
-                if (
-                    obj_type in self.data["objects"]
-                    and target in self.data["objects"][obj_type]
-                ):
-                    obj_data = self.data["objects"][obj_type][target]
-                    docname = obj_data[0]
-                    target_id = target
-                    display_text = target
-                    if "." in target and obj_type in ["method", "property"]:
-                        # If it's a qualified name, use the full name for ID
-                        target_id = target
-                        # But extract just the member name for display
-                        display_text = target.split(".")[-1]
-                    return make_refnode(
-                        builder,
-                        fromdocname,
-                        docname,
-                        f"{obj_type}-{target_id}",
-                        contnode,
-                        display_text,
-                    )
-        else:
-            # Map specific role to object type
-            role_to_objtype = {
-                "class": "class",
-                "interface": "interface",
-                "meth": "method",
-                "prop": "property",
-                "func": "function",
-                "var": "variable",
-            }
-
-            obj_type = role_to_objtype.get(typ)
-            if (
+            # Search in the object types the name is registered as
+            obj_types = [
                 obj_type
-                and obj_type in self.data["objects"]
-                and target in self.data["objects"][obj_type]
-            ):
-                obj_data = self.data["objects"][obj_type][target]
-                docname = obj_data[0]
-                target_id = target
-                display_text = target
-                if "." in target and obj_type in ["method", "property"]:
-                    # If it's a qualified name, use the full name for ID
-                    target_id = target
-                    # But extract just the member name for display
-                    display_text = target.split(".")[-1]
-                return make_refnode(
-                    builder,
-                    fromdocname,
-                    docname,
-                    f"{obj_type}-{target_id}",
-                    contnode,
-                    display_text,
-                )
-
+                for obj_type in self.object_types
+                if obj_type in registered_types
+            ]
+        elif typ == "prop":
             # Fallback: if looking for a property but it's registered as a
             # method (e.g., getter/setter properties in TypeScript)
-            if (
-                typ == "prop"
-                and "method" in self.data["objects"]
-                and target in self.data["objects"]["method"]
-            ):
-                obj_data = self.data["objects"]["method"][target]
-                docname = obj_data[0]
-                target_id = target
-                display_text = target
-                if "." in target:
-                    # If it's a qualified name, use the full name for ID
-                    target_id = target
-                    # But extract just the member name for display
-                    display_text = target.split(".")[-1]
-                return make_refnode(
-                    builder,
-                    fromdocname,
-                    docname,
-                    f"method-{target_id}",
-                    contnode,
-                    display_text,
-                )
+            obj_types = ["property", "method"]
+        else:
+            obj_types = [_ROLE_TO_OBJTYPE.get(typ)]
+
+        for obj_type in obj_types:
+            refnode = self._make_ref(
+                builder, fromdocname, obj_type, target, contnode
+            )
+            if refnode is not None:
+                return refnode
 
         logger.debug("TypeScript xref not found: %s:%s", typ, target)
         return None
@@ -721,59 +831,38 @@ class TypeScriptDomain(Domain):
     ) -> list[tuple[str, reference]]:
         """Resolve any cross-reference (used for 'any' role)."""
         results = []
+        registered_types = self.data["by_name"].get(target)
+        if not registered_types:
+            return results
 
         for obj_type in self.object_types:
-            if (
-                obj_type in self.data["objects"]
-                and target in self.data["objects"][obj_type]
-            ):
-                obj_data = self.data["objects"][obj_type][target]
-                docname = obj_data[0]
-                # Check if we should include this in results (not noindex)
-                if (
-                    len(obj_data) < OBJDATA_TUPLE_LENGTH
-                    or not obj_data[OBJDATA_NOINDEX_INDEX]
-                ):
-                    refnode = make_refnode(
-                        builder,
-                        fromdocname,
-                        docname,
-                        f"{obj_type}-{target}",
-                        contnode,
-                        target,
-                    )
-                    results.append((f"ts:{obj_type}", refnode))
+            if obj_type not in registered_types:
+                continue
+            obj_data = self._find_object(obj_type, target)
+            # Check if we should include this in results (not noindex)
+            if obj_data is not None and not obj_data[2]:
+                refnode = make_refnode(
+                    builder,
+                    fromdocname,
+                    obj_data[0],
+                    f"{obj_type}-{target}",
+                    contnode,
+                    target,
+                )
+                results.append((f"ts:{obj_type}", refnode))
 
         return results
 
     def get_objects(self) -> Iterator[tuple[str, str, str, str, str, int]]:
         """Return an iterable of "object descriptions"."""
-        objects_list = []
-        for obj_type, objects in self.data["objects"].items():
-            for name, obj_data in objects.items():
-                # Unpack object data with support for older format
-                if len(obj_data) >= OBJDATA_TUPLE_LENGTH:
-                    docname, _, noindex = obj_data
-                else:
-                    docname, _ = obj_data
-                    noindex = False
-
-                # Only add objects that shouldn't be hidden from TOC
-                if not noindex:
-                    objects_list.append(
-                        (
-                            name,
-                            name,
-                            obj_type,
-                            docname,
-                            f"{obj_type}-{name}",
-                            1,
-                        )
-                    )
-
-        # Sort objects by name (the first element in the tuple)
-        objects_list.sort(key=lambda x: x[0])
-        yield from objects_list
+        objects = self.data["objects"]
+        # Sort the keys by name, building the descriptions as they're consumed
+        for key in sorted(objects, key=itemgetter(1)):
+            docname, _synopsis, noindex = objects[key]
+            # Only add objects that shouldn't be hidden from TOC
+            if not noindex:
+                obj_type, name = key
+                yield (name, name, obj_type, docname, f"{obj_type}-{name}", 1)
 
     def get_full_qualified_name(self, node: nodes.Element) -> str | None:
         """Get the fully qualified name of a node."""
@@ -800,8 +889,6 @@ class TypeScriptDomain(Domain):
             noindex: If True, the object won't appear in the global index/TOC
 
         """
-        if obj_type not in self.data["objects"]:
-            self.data["objects"][obj_type] = {}
-
         docname = getattr(self.env, "docname", "")
-        self.data["objects"][obj_type][name] = (docname, "", noindex)
+        key = (sys.intern(obj_type), name)
+        self.add_objects(docname, {key: (docname, "", noindex)})
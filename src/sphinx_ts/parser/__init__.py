@@ -16,6 +16,7 @@ from .ast_nodes import (
 )
 from .doc_comment import TSDocComment
 from .mixins import NamedObjectMixin
+from .parse_cache import TSParseCache, get_parse_cache
 from .ts_parser import TSParser
 from .value_parser import TSValueParser
 
@@ -28,8 +29,10 @@ __all__ = [
     "TSInterface",
     "TSMember",
     "TSMethod",
+    "TSParseCache",
     "TSParser",
     "TSProperty",
     "TSValueParser",
     "TSVariable",
+    "get_parse_cache",
 ]
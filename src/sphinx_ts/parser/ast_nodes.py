@@ -17,6 +17,22 @@ if TYPE_CHECKING:
 class TSMember(NamedObjectMixin):
     """Base class for TypeScript members (methods, properties, etc.)."""
 
+    __slots__ = (
+        "doc_comment",
+        "end_line",
+        "is_export",
+        "is_optional",
+        "is_private",
+        "is_protected",
+        "is_readonly",
+        "is_static",
+        "kind",
+        "modifiers",
+        "name",
+        "start_line",
+        "type_annotation",
+    )
+
     def __init__(self, name: str, kind: str) -> None:
         """Initialize a TypeScript member.
 
@@ -44,6 +60,13 @@ class TSMember(NamedObjectMixin):
 class TSMethod(TSMember):
     """Represents a TypeScript method."""
 
+    __slots__ = (
+        "is_async",
+        "is_generator",
+        "parameters",
+        "return_type",
+    )
+
     def __init__(self, name: str) -> None:
         """Initialize a TypeScript method.
 
@@ -62,6 +85,8 @@ class TSMethod(TSMember):
 class TSProperty(TSMember):
     """Represents a TypeScript property."""
 
+    __slots__ = ("default_value",)
+
     def __init__(self, name: str) -> None:
         """Initialize a TypeScript property.
 
@@ -77,6 +102,22 @@ class TSProperty(TSMember):
 class TSClass(NamedObjectMixin):
     """Represents a TypeScript class."""
 
+    __slots__ = (
+        "constructor",
+        "doc_comment",
+        "end_line",
+        "extends",
+        "implements",
+        "is_abstract",
+        "is_export",
+        "methods",
+        "modifiers",
+        "name",
+        "properties",
+        "start_line",
+        "type_parameters",
+    )
+
     def __init__(self, name: str) -> None:
         """Initialize a TypeScript class.
 
@@ -103,6 +144,18 @@ class TSClass(NamedObjectMixin):
 class TSInterface(NamedObjectMixin):
     """Represents a TypeScript interface."""
 
+    __slots__ = (
+        "doc_comment",
+        "end_line",
+        "extends",
+        "is_export",
+        "methods",
+        "name",
+        "properties",
+        "start_line",
+        "type_parameters",
+    )
+
     def __init__(self, name: str) -> None:
         """Initialize a TypeScript interface.
 
@@ -125,6 +178,17 @@ class TSInterface(NamedObjectMixin):
 class TSVariable(NamedObjectMixin):
     """Represents a TypeScript variable/constant."""
 
+    __slots__ = (
+        "doc_comment",
+        "end_line",
+        "is_export",
+        "kind",
+        "name",
+        "start_line",
+        "type_annotation",
+        "value",
+    )
+
     def __init__(self, name: str) -> None:
         """Initialize a TypeScript variable.
 
@@ -146,6 +210,13 @@ class TSVariable(NamedObjectMixin):
 class TSEnumMember(NamedObjectMixin):
     """Represents a TypeScript enum member."""
 
+    __slots__ = (
+        "computed_value",
+        "doc_comment",
+        "name",
+        "value",
+    )
+
     def __init__(self, name: str) -> None:
         """Initialize a TypeScript enum member.
 
@@ -163,6 +234,17 @@ class TSEnumMember(NamedObjectMixin):
 class TSEnum(NamedObjectMixin):
     """Represents a TypeScript enum."""
 
+    __slots__ = (
+        "doc_comment",
+        "end_line",
+        "is_const",
+        "is_declare",
+        "is_export",
+        "members",
+        "name",
+        "start_line",
+    )
+
     def __init__(self, name: str) -> None:
         """Initialize a TypeScript enum.
 
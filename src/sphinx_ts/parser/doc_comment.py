@@ -8,10 +8,35 @@ from __future__ import annotations
 
 import re
 
+# Start of the tag block that follows the description
+_DESCRIPTION_END_RE = re.compile(r"\n\s*@")
+# Boundaries between tags: a new line starting with @name
+_TAG_BOUNDARY_RE = re.compile(r"\n\s*@(?=\w+(?:\s|$))")
+# A tag name and its (possibly multi-line) value
+_TAG_RE = re.compile(r"^(\w+)(?:\s+(.*))?$", re.DOTALL)
+# @param {type} name description
+_PARAM_RE = re.compile(r"(?:\{([^}]+)\})?\s*(\w+)(?:\s+(.+))?", re.DOTALL)
+# Markdown code fences around examples
+_FENCE_OPEN_RE = re.compile(r"```(?:typescript|ts)?\s*")
+_FENCE_CLOSE_RE = re.compile(r"```\s*$", re.MULTILINE)
+
 
 class TSDocComment:
     """Represents a TypeScript JSDoc comment."""
 
+    __slots__ = (
+        "__weakref__",
+        "_sorted_params",
+        "deprecated",
+        "description",
+        "examples",
+        "params",
+        "returns",
+        "since",
+        "tags",
+        "text",
+    )
+
     def __init__(self, text: str) -> None:
         """Initialize a TypeScript JSDoc comment.
 
@@ -28,9 +53,25 @@ class TSDocComment:
         self.deprecated: str | None = None
         self.since: str | None = None
         self.tags: dict[str, str] = {}
+        self._sorted_params: list[tuple[str, str]] | None = None
 
         self._parse()
 
+    @property
+    def sorted_params(self) -> list[tuple[str, str]]:
+        """Get the ``@param`` entries sorted by name.
+
+        The list is computed on first access and reused afterwards, so it
+        must not be mutated by callers.
+        """
+        if self._sorted_params is None:
+            params = self.params.items()
+            # A single entry is already in order, so skip the sort
+            self._sorted_params = (
+                sorted(params) if len(self.params) > 1 else list(params)
+            )
+        return self._sorted_params
+
     def _parse(self) -> None:
         """Parse JSDoc comment text."""
         # Remove comment markers
@@ -64,7 +105,7 @@ class TSDocComment:
             self._parse_tags(content.strip())
         else:
             # Split into description and tags
-            parts = re.split(r"\n\s*@", content, maxsplit=1)
+            parts = _DESCRIPTION_END_RE.split(content, maxsplit=1)
             self.description = parts[0].strip()
 
             if len(parts) > 1:
@@ -74,8 +115,7 @@ class TSDocComment:
     def _parse_tags(self, tag_content: str) -> None:
         """Parse JSDoc tags."""
         # Use more precise regex to find tag boundaries
-        tag_pattern = r"\n\s*@(?=\w+(?:\s|$))"
-        tag_parts = re.split(tag_pattern, tag_content)
+        tag_parts = _TAG_BOUNDARY_RE.split(tag_content)
 
         # Clear examples list before parsing to avoid duplicates
         self.examples = []
@@ -86,7 +126,7 @@ class TSDocComment:
 
             # Remove leading @ if present and extract tag name and value
             clean_part = part.lstrip("@").strip()
-            match = re.match(r"^(\w+)(?:\s+(.*))?$", clean_part, re.DOTALL)
+            match = _TAG_RE.match(clean_part)
             if not match:
                 continue
 
@@ -96,11 +136,7 @@ class TSDocComment:
 
             if tag_name == "param":
                 # Parse @param {type} name description
-                match = re.match(
-                    r"(?:\{([^}]+)\})?\s*(\w+)(?:\s+(.+))?",
-                    tag_value,
-                    re.DOTALL,
-                )
+                match = _PARAM_RE.match(tag_value)
                 if match:
                     _, param_name, param_desc = match.groups()
                     # Clean up description by removing leading dashes
@@ -114,12 +150,8 @@ class TSDocComment:
             elif tag_name == "example":
                 # Process markdown code blocks more carefully
                 # Remove code block markers
-                cleaned_example = re.sub(
-                    r"```(?:typescript|ts)?\s*", "", tag_value
-                )
-                cleaned_example = re.sub(
-                    r"```\s*$", "", cleaned_example, flags=re.MULTILINE
-                )
+                cleaned_example = _FENCE_OPEN_RE.sub("", tag_value)
+                cleaned_example = _FENCE_CLOSE_RE.sub("", cleaned_example)
                 cleaned_example = cleaned_example.strip()
 
                 if cleaned_example:  # Only add non-empty examples
@@ -14,6 +14,9 @@ class NamedObjectMixin:
     across all TypeScript AST node classes that have a 'name' attribute.
     """
 
+    # Empty so subclasses declaring __slots__ get no per-instance __dict__
+    __slots__ = ()
+
     name: str  # Type hint for the name attribute that classes must have
 
     def __lt__(self, other: object) -> bool:
@@ -0,0 +1,165 @@
+"""TypeScript Parse Cache Module.
+
+Contains the TSParseCache class that keeps parsed TypeScript files between
+Sphinx builds, so sources that did not change are not parsed again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import pickle
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ts_parser import TSParser
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the parsed data layout changes, to discard stale caches
+CACHE_VERSION = 1
+
+# Name of the cache file inside the Sphinx doctree directory
+CACHE_FILENAME = "sphinx-ts-parse-cache.pickle"
+
+# Modification time (ns), size, content digest and parsed data of a file
+_CacheEntry = tuple[int, int, bytes, dict[str, Any]]
+
+
+def _digest(source_code: bytes) -> bytes:
+    """Hash file contents to tell real changes from touched files."""
+    return hashlib.blake2b(source_code, digest_size=16).digest()
+
+
+class TSParseCache:
+    """Persistent cache of parsed TypeScript files.
+
+    Entries are keyed on the file path. A file whose modification time and
+    size are unchanged is served without being read; otherwise its contents
+    are hashed and it is only parsed again if the hash differs. Without a
+    cache file the entries are only kept in memory.
+    """
+
+    def __init__(self, cache_path: Path | None = None) -> None:
+        """Initialize the cache and load any previously saved entries.
+
+        Args:
+        ----
+            cache_path: The file the cache is loaded from and saved to
+
+        """
+        self.cache_path: Path | None = None
+        self._entries: dict[str, _CacheEntry] = {}
+        self._dirty = False
+        if cache_path is not None:
+            self.load(cache_path)
+
+    def load(self, cache_path: Path) -> None:
+        """Switch to a cache file and load its entries.
+
+        Entries saved by another cache version, or that can't be read, are
+        discarded and the cache starts empty.
+
+        Args:
+        ----
+            cache_path: The file the cache is loaded from and saved to
+
+        """
+        self.cache_path = cache_path
+        self._entries = {}
+        self._dirty = False
+        try:
+            with self.cache_path.open("rb") as f:
+                # The cache is written by this extension next to Sphinx's
+                # own pickled environment
+                version, entries = pickle.load(f)  # noqa: S301
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.debug("Ignoring parse cache %s: %s", self.cache_path, e)
+            return
+
+        if version == CACHE_VERSION:
+            self._entries = entries
+
+    def save(self) -> None:
+        """Save the entries if any changed, dropping deleted files."""
+        if self.cache_path is None or not self._dirty:
+            return
+
+        self._entries = {
+            path: entry
+            for path, entry in self._entries.items()
+            if Path(path).exists()
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.cache_path.open("wb") as f:
+                pickle.dump(
+                    (CACHE_VERSION, self._entries),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except OSError as e:
+            logger.warning(
+                "Failed to save parse cache %s: %s", self.cache_path, e
+            )
+            return
+        self._dirty = False
+
+    def parse_file(self, parser: TSParser, file_path: Path) -> dict[str, Any]:
+        """Get the parsed data of a file, parsing it only if it changed.
+
+        Args:
+        ----
+            parser: The parser to use for new or changed files
+            file_path: Path to the TypeScript file
+
+        Returns:
+        -------
+            The parsed file data, as returned by ``TSParser.parse_file``
+
+        """
+        key = str(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # Leave reporting the missing file to the parser
+            return parser.parse_file(file_path)
+
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry[0] == stat.st_mtime_ns
+            and entry[1] == stat.st_size
+        ):
+            return entry[3]
+
+        source_code = file_path.read_bytes()
+        digest = _digest(source_code)
+        if entry is not None and entry[2] == digest:
+            # Touched but not changed; remember the new stat
+            parsed_data = entry[3]
+        else:
+            parsed_data = parser.parse_file(file_path, source_code)
+
+        self._entries[key] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            digest,
+            parsed_data,
+        )
+        self._dirty = True
+        return parsed_data
+
+
+@cache
+def get_parse_cache() -> TSParseCache:
+    """Get the parse cache shared by all directives in this process.
+
+    The extension points it at the Sphinx doctree directory when the builder
+    is initialized and saves it when the build finishes.
+    """
+    return TSParseCache()
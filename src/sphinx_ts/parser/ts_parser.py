@@ -40,8 +40,22 @@ class TSParser:
         self.language = Language(language_capsule)
         self.parser.language = self.language
 
-    def parse_file(self, file_path: str | Path) -> dict[str, Any]:
-        """Parse a TypeScript file and return extracted information."""
+    def parse_file(
+        self, file_path: str | Path, source_code: bytes | None = None
+    ) -> dict[str, Any]:
+        """Parse a TypeScript file and return extracted information.
+
+        Args:
+        ----
+            file_path: Path to the TypeScript file
+            source_code: The file contents, if the caller already read them
+
+        Returns:
+        -------
+            The classes, interfaces, variables, functions, enums and types
+            declared in the file
+
+        """
         file_path = Path(file_path)
 
         # Return empty result if parser is not available
@@ -55,8 +69,9 @@ class TSParser:
                 "file_path": str(file_path),
             }
 
-        with Path(file_path).open("rb") as f:
-            source_code = f.read()
+        if source_code is None:
+            with Path(file_path).open("rb") as f:
+                source_code = f.read()
 
         tree = self.parser.parse(source_code)
 
@@ -6,6 +6,9 @@ values and literals.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any
+
 import tree_sitter
 from tree_sitter import Language, Parser
 from tree_sitter_typescript import language_typescript
@@ -16,50 +19,128 @@ MAX_INLINE_ITEM_LENGTH = 30
 MAX_INLINE_OBJECT_PAIRS = 2
 MAX_INLINE_PAIR_LENGTH = 40
 
+# Number of distinct values whose parse/format results are memoized
+VALUE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=1)
+def _fragment_parser() -> Parser:
+    """Get the parser shared by all value fragments."""
+    parser = Parser()
+    parser.language = Language(language_typescript())
+    return parser
+
 
 class TSValueParser:
     """Parser for TypeScript values and literals."""
 
     @staticmethod
-    def parse_value(value: str | None) -> dict:
+    @lru_cache(maxsize=VALUE_CACHE_SIZE)
+    def parse_value(value: str | None) -> dict[str, Any]:
         """Parse a TypeScript value into a structured representation.
 
+        Results are memoized per value string, so the returned dictionary is
+        shared between callers and must not be modified.
+
         Args:
         ----
             value: The TypeScript value as a string
 
         Returns:
         -------
-            A dictionary with information about the value
+            A dictionary with information about the value, including the
+            ``is_array`` and ``is_complex`` shape flags
 
         """
         if value is None or not value.strip():
-            return {"type": "unknown", "value": "", "properties": []}
+            return {
+                "type": "unknown",
+                "value": "",
+                "properties": [],
+                "is_array": False,
+                "is_complex": False,
+            }
 
         value = value.strip()
+        value_node, wrapper = TSValueParser._find_value_node(value)
+        return TSValueParser._classify_value_node(value_node, wrapper, value)
 
-        # Create a parser for the fragment
-        parser = Parser()
-        language = Language(language_typescript())
-        parser.language = language
+    @staticmethod
+    @lru_cache(maxsize=VALUE_CACHE_SIZE)
+    def parse_and_format(value: str | None) -> tuple[dict[str, Any], str]:
+        """Parse a TypeScript value and pretty-print it from a single parse.
+
+        Equivalent to ``(parse_value(value), format_value(value))``, but the
+        value is only run through tree-sitter once. Results are memoized per
+        value string and shared between callers.
 
+        Args:
+        ----
+            value: The TypeScript value as a string
+
+        Returns:
+        -------
+            The parsed value information and the formatted value
+
+        """
+        if value is None or not value.strip():
+            return TSValueParser.parse_value(value), ""
+
+        value = value.strip()
+        value_node, wrapper = TSValueParser._find_value_node(value)
+        parsed = TSValueParser._classify_value_node(value_node, wrapper, value)
+        return parsed, TSValueParser._format_value_node(
+            value_node, wrapper, value, parsed
+        )
+
+    @staticmethod
+    def _find_value_node(value: str) -> tuple[tree_sitter.Node | None, str]:
+        """Parse a stripped value and find its expression node.
+
+        Args:
+        ----
+            value: The stripped TypeScript value
+
+        Returns:
+        -------
+            The value node, if found, and the wrapper source it belongs to
+
+        """
         # Wrap the value in a variable declaration to help parser
         wrapper = f"const __temp__ = {value};"
-        tree = parser.parse(bytes(wrapper, "utf8"))
+        tree = _fragment_parser().parse(bytes(wrapper, "utf8"))
 
         if not tree or not tree.root_node:
-            return {"type": "unknown", "value": value, "properties": []}
+            return None, wrapper
 
         # Find the value node
-        value_node = None
         for node in tree.root_node.children:
             if node.type == "lexical_declaration":
                 for child in node.children:
                     if child.type == "variable_declarator":
-                        value_node = child.child_by_field_name("value")
-                        break
+                        return child.child_by_field_name("value"), wrapper
                 break
 
+        return None, wrapper
+
+    @staticmethod
+    def _classify_value_node(
+        value_node: tree_sitter.Node | None, wrapper: str, value: str
+    ) -> dict[str, Any]:
+        """Describe a parsed value node as returned by ``parse_value``."""
+        parsed = TSValueParser._describe_value_node(value_node, wrapper, value)
+        # Derive the shape flags once so callers need not re-inspect the type
+        value_type = parsed["type"]
+        is_typed_array = value_type.endswith("[]")
+        parsed["is_array"] = is_typed_array or value_type == "array"
+        parsed["is_complex"] = is_typed_array or value_type == "object"
+        return parsed
+
+    @staticmethod
+    def _describe_value_node(
+        value_node: tree_sitter.Node | None, wrapper: str, value: str
+    ) -> dict[str, Any]:
+        """Build the type, value and properties of a parsed value node."""
         if not value_node:
             return {"type": "unknown", "value": value, "properties": []}
 
@@ -83,7 +164,37 @@ class TSValueParser:
         return {"type": "unknown", "value": value, "properties": []}
 
     @staticmethod
-    def _parse_object(node: tree_sitter.Node, source_code: str) -> dict:
+    def _format_value_node(
+        value_node: tree_sitter.Node | None,
+        wrapper: str,
+        value: str,
+        parsed: dict[str, Any],
+    ) -> str:
+        """Pretty-print a parsed value node as returned by ``format_value``."""
+        # Always pretty-print objects and arrays, regardless of their complexity
+        # This ensures constants like MATH_CONSTANTS are properly formatted
+        if (
+            not parsed["is_complex"]
+            and not (value.startswith("{") and value.endswith("}"))
+            and not (value.startswith("[") and value.endswith("]"))
+        ):
+            return value
+
+        if not value_node:
+            return value
+
+        try:
+            return TSValueParser._format_node(
+                value_node, bytes(wrapper, "utf8"), 0
+            )
+        except (ValueError, TypeError, AttributeError):
+            # If formatting fails, return the original
+            return value
+
+    @staticmethod
+    def _parse_object(
+        node: tree_sitter.Node, source_code: str
+    ) -> dict[str, Any]:
         """Parse an object literal."""
         properties = []
         object_type = "object"
@@ -138,7 +249,9 @@ class TSValueParser:
         return {"type": object_type, "value": "{...}", "properties": properties}
 
     @staticmethod
-    def _parse_array(node: tree_sitter.Node, source_code: str) -> dict:
+    def _parse_array(
+        node: tree_sitter.Node, source_code: str
+    ) -> dict[str, Any]:
         """Parse an array literal."""
         items = []
         array_type = "array"
@@ -181,9 +294,12 @@ class TSValueParser:
         }
 
     @staticmethod
+    @lru_cache(maxsize=VALUE_CACHE_SIZE)
     def format_value(value: str | None, *, pretty: bool = True) -> str:
         """Format a TypeScript value for display.
 
+        Results are memoized per value string and ``pretty`` flag.
+
         Args:
         ----
             value: The TypeScript value as a string
@@ -197,53 +313,10 @@ class TSValueParser:
         if value is None or not value.strip():
             return ""
 
-        value = value.strip()
-
-        # Parse the value
-        parsed = TSValueParser.parse_value(value)
-
-        # Always pretty-print objects and arrays, regardless of their complexity
-        # This ensures constants like MATH_CONSTANTS are properly formatted
-        if not pretty or (
-            parsed["type"] != "object"
-            and not parsed["type"].endswith("[]")
-            and not (value.startswith("{") and value.endswith("}"))
-            and not (value.startswith("[") and value.endswith("]"))
-        ):
-            return value
-
-        # Create a parser for proper formatting
-        parser = Parser()
-        language = Language(language_typescript())
-        parser.language = language
-
-        # Wrap in a declaration for easier parsing
-        wrapper = f"const __temp__ = {value};"
-        tree = parser.parse(bytes(wrapper, "utf8"))
-
-        if not tree or not tree.root_node:
-            return value
-
-        try:
-            # Find the declaration node
-            for node in tree.root_node.children:
-                if node.type == "lexical_declaration":
-                    # Format the code with proper indentation
-                    value_node = None
-                    for child in node.children:
-                        if child.type == "variable_declarator":
-                            value_node = child.child_by_field_name("value")
-                            break
-
-                    if value_node:
-                        return TSValueParser._format_node(
-                            value_node, bytes(wrapper, "utf8"), 0
-                        )
-        except (ValueError, TypeError, AttributeError):
-            # If formatting fails, return the original
-            return value
+        if not pretty:
+            return value.strip()
 
-        return value
+        return TSValueParser.parse_and_format(value)[1]
 
     @staticmethod
     def _format_node(
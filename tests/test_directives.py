@@ -1,11 +1,19 @@
 """Tests for TypeScript auto-documentation directives."""
 
 from pathlib import Path
-from unittest.mock import Mock, PropertyMock, patch
+from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
-
-from sphinx_ts.directives import TSAutoDirective, TSAutoEnumDirective
+from docutils import nodes
+from docutils.core import publish_doctree
+from sphinx import addnodes
+
+from sphinx_ts.directives import (
+    TSAutoDataDirective,
+    TSAutoDirective,
+    TSAutoEnumDirective,
+)
+from sphinx_ts.directives.base import _format_type_annotation
 from sphinx_ts.parser import (
     TSClass,
     TSDocComment,
@@ -20,6 +28,7 @@ from sphinx_ts.parser import (
 
 # Test constants
 EXPECTED_INTERFACE_PROPERTIES_COUNT = 2
+EXPECTED_RST_PARSE_COUNT = 2
 
 
 class TestTSAutoDirectiveCore:
@@ -62,6 +71,20 @@ class TestTSAutoDirectiveCore:
         assert directive.format_type_annotation(": number") == "number"
         assert directive.format_type_annotation("  : boolean  ") == "boolean"
 
+    def test_format_type_annotation_is_memoized(self) -> None:
+        """Test that repeated type annotations are formatted once."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+        _format_type_annotation.cache_clear()
+
+        for _ in range(3):
+            assert (
+                directive.format_parameter_type("string |  null")
+                == "string | null"
+            )
+
+        info = _format_type_annotation.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
     def test_create_rst_content_empty(self) -> None:
         """Test creating RST content from empty lines."""
         directive = TSAutoDirective.__new__(TSAutoDirective)
@@ -138,6 +161,87 @@ class TestTSAutoDirectiveCore:
 
             assert result is None
 
+    def test_find_object_kinds_indexes_once(self, tmp_path: Path) -> None:
+        """Test that the name index is built once for unchanged sources."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+        test_file = tmp_path / "file.ts"
+        test_file.write_text("export const config = {};")
+        directive.get_source_files = Mock(return_value=[test_file])
+        directive.parser = Mock()
+        directive.parser.parse_file.return_value = {
+            "variables": [TSVariable("config")],
+            "functions": [],
+        }
+        TSAutoDirective._source_index_cache.clear()
+
+        assert directive.find_object_kinds("Config") == {"variable"}
+        assert directive.find_object_kinds("missing") == frozenset()
+
+        with patch.object(
+            type(directive), "env", new_callable=PropertyMock
+        ) as mock_env_prop:
+            mock_env_prop.return_value = Mock(docname="test_doc")
+            directive._register_object_with_domain = Mock()
+            result = directive.find_object_in_files("CONFIG", "variable")
+
+        assert result is not None
+        assert result["object"].name == "config"
+        assert result["file_path"] == test_file
+        directive._register_object_with_domain.assert_called_once_with(
+            "variable", "config", "test_doc"
+        )
+        directive.parser.parse_file.assert_called_once_with(
+            test_file, test_file.read_bytes()
+        )
+
+    def test_register_members_with_domain_batches_entries(self) -> None:
+        """Test that members are registered in one batch by qualified name."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+
+        with patch.object(
+            type(directive), "env", new_callable=PropertyMock
+        ) as mock_env_prop:
+            mock_env = Mock(docname="test_doc")
+            mock_env_prop.return_value = mock_env
+
+            directive._register_members_with_domain(
+                "Shape",
+                methods=[TSMethod("area"), TSMethod("")],
+                properties=[TSProperty("sides")],
+            )
+
+        mock_env.get_domain.return_value.add_objects.assert_called_once_with(
+            "test_doc",
+            {
+                ("method", "Shape.area"): ("test_doc", "Shape.area", True),
+                ("property", "Shape.sides"): ("test_doc", "Shape.sides", True),
+            },
+        )
+
+    def test_process_object_any_tries_declared_kinds_only(self) -> None:
+        """Test that lookups skip kinds the name is not declared as."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+        directive.find_object_kinds = Mock(return_value=frozenset({"type"}))
+        directive._process_object_common = Mock(return_value={"object": 1})
+
+        object_type, result = directive._process_object_any(
+            "Alias", ("variable", "function", "type")
+        )
+
+        assert object_type == "type"
+        assert result == {"object": 1}
+        directive._process_object_common.assert_called_once()
+        assert directive._process_object_common.call_args.args == (
+            "Alias",
+            "type",
+        )
+
+        directive.find_object_kinds.return_value = frozenset()
+        assert directive._process_object_any("Missing", ("variable",)) == (
+            None,
+            None,
+        )
+
 
 class TestTSDocCommentFormatting:
     """Test JSDoc comment formatting functionality."""
@@ -185,6 +289,28 @@ class TestTSDocCommentFormatting:
         assert len(result) >= 1
         assert "Simple description" in result[0]
 
+    def test_format_comment_cached_per_flags(self) -> None:
+        """Test that formatted lines are reused but never shared."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+
+        doc_comment = TSDocComment("""
+        /**
+         * Cached description.
+         * @param a First param
+         */
+        """)
+
+        first = directive.format_doc_comment(doc_comment)
+        first.append("mutated by caller")
+        second = directive.format_doc_comment(doc_comment)
+        without_params = directive.format_doc_comment(
+            doc_comment, skip_params=True
+        )
+
+        assert "mutated by caller" not in second
+        assert any("First param" in line for line in second)
+        assert not any("First param" in line for line in without_params)
+
     def test_format_comment_params_only(self) -> None:
         """Test formatting comment with only parameters."""
         directive = TSAutoDirective.__new__(TSAutoDirective)
@@ -203,6 +329,142 @@ class TestTSDocCommentFormatting:
         assert "First param" in content
         assert "Second param" in content
 
+    def test_plain_doc_comment_skips_rst_parse(self) -> None:
+        """Test that markup-free descriptions become paragraphs directly."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+        nested_parse = MagicMock()
+        directive.state = Mock(nested_parse=nested_parse)
+
+        content = addnodes.desc_content()
+        doc_comment = TSDocComment("""
+        /**
+         * First paragraph.
+         *
+         * Second paragraph.
+         */
+        """)
+        directive._add_standard_doc_content(content, doc_comment)
+
+        nested_parse.assert_not_called()
+        assert [child.astext() for child in content.children] == [
+            "First paragraph.",
+            "Second paragraph.",
+        ]
+        assert all(isinstance(c, nodes.paragraph) for c in content.children)
+
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            ["First paragraph.", "", "Second paragraph."],
+            ["Uses -1 as a sentinel and 2 + 2 as a sum."],
+            ["Choose one", "", "-"],
+            ["Choose one", "", "+"],
+            ["Steps", "", "1."],
+            ["Steps", "", "a)"],
+            ["-v  Verbose output"],
+            ["--verbose  Print more"],
+            ["/V  Verbose output"],
+            ["Heading", "!!!!!!!"],
+            ["Title", "$$$$$"],
+            ["Hi", "=="],
+            ["Before", "", "----------", "", "After"],
+        ],
+    )
+    def test_plain_rst_fast_path_matches_full_parse(
+        self, lines: list[str]
+    ) -> None:
+        """Test that skipping the RST parse never changes the output."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+
+        parsed = publish_doctree(
+            "\n".join(lines), settings_overrides={"report_level": 5}
+        ).children
+        plain_nodes = directive._plain_rst_nodes(lines)
+        rendered = parsed if plain_nodes is None else plain_nodes
+
+        assert [(type(n), n.astext()) for n in rendered] == [
+            (type(n), n.astext()) for n in parsed
+        ]
+
+    def test_params_only_doc_comment_is_not_formatted(self) -> None:
+        """Test that comments with nothing to render are skipped early."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+        directive.format_doc_comment = Mock()
+
+        content = addnodes.desc_content()
+        doc_comment = TSDocComment("""
+        /**
+         * @param host The server host
+         */
+        """)
+        directive._add_standard_doc_content(
+            content, doc_comment, skip_params=True
+        )
+
+        directive.format_doc_comment.assert_not_called()
+        assert not content.children
+
+    @pytest.mark.parametrize(
+        ("multi_block", "expected_blocks"), [(False, 1), (True, 2)]
+    )
+    def test_examples_block_layout(
+        self, multi_block: bool, expected_blocks: int
+    ) -> None:
+        """Test that examples are coalesced unless configured otherwise."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+        doc_comment = TSDocComment("""
+        /**
+         * @example
+         * first();
+         * @example
+         * second();
+         */
+        """)
+
+        with patch.object(
+            type(directive), "config", new_callable=PropertyMock
+        ) as mock_config:
+            mock_config.return_value = Mock(
+                sphinx_ts_multi_block_examples=multi_block
+            )
+            content = addnodes.desc_content()
+            directive._add_examples_section(content, doc_comment)
+
+        blocks = list(content.findall(nodes.literal_block))
+        assert len(blocks) == expected_blocks
+        text = "".join(block.astext() for block in blocks)
+        assert "first();" in text
+        assert "second();" in text
+
+    @pytest.mark.parametrize(
+        ("multi_block", "expected_blocks"), [(False, 1), (True, 2)]
+    )
+    def test_examples_rst_block_layout(
+        self, multi_block: bool, expected_blocks: int
+    ) -> None:
+        """Test that the RST rendering follows the same example layout."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+        doc_comment = TSDocComment("""
+        /**
+         * @example
+         * first();
+         * @example
+         * second();
+         */
+        """)
+
+        with patch.object(
+            type(directive), "config", new_callable=PropertyMock
+        ) as mock_config:
+            mock_config.return_value = Mock(
+                sphinx_ts_multi_block_examples=multi_block
+            )
+            lines = directive.format_doc_comment(doc_comment)
+
+        assert lines.count(".. code-block:: typescript") == expected_blocks
+        assert "   first();" in lines
+        assert "   second();" in lines
+
 
 class TestTypeScriptObjectCreation:
     """Test creating TypeScript objects for documentation."""
@@ -346,6 +608,85 @@ class TestRSTGeneration:
 
         assert signature == "title: string | null"
 
+    def test_distinct_properties_render_separately(self) -> None:
+        """Test that same-named properties render their own types."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+
+        first_prop = TSProperty("count")
+        first_prop.type_annotation = "number"
+        second_prop = TSProperty("count")
+        second_prop.type_annotation = "string"
+
+        first = directive._format_property_common(first_prop, "Counter")
+        second = directive._format_property_common(second_prop, "Counter")
+
+        assert first is not None
+        assert second is not None
+        assert "number" in first.astext()
+        assert "string" in second.astext()
+
+    def test_parameter_list_skipped_without_descriptions(self) -> None:
+        """Test that undocumented parameters do not get a section."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+
+        method = TSMethod("add")
+        method.parameters = [
+            {"name": "a", "type": "number"},
+            {"name": "b", "type": "number"},
+        ]
+
+        desc = directive._format_method_common(method, "Calculator")
+        assert desc is not None
+        assert "Parameters" not in desc.astext()
+
+        method = TSMethod("subtract")
+        method.parameters = [
+            {"name": "a", "type": "number"},
+            {"name": "b", "type": "number"},
+        ]
+        method.doc_comment = TSDocComment("""
+        /**
+         * @param a The minuend
+         */
+        """)
+
+        desc = directive._format_method_common(method, "Calculator")
+        assert desc is not None
+        assert "Parameters" in desc.astext()
+        assert "The minuend" in desc.astext()
+
+    def test_signature_type_params_and_extends(self) -> None:
+        """Test that generics and base types are emitted as structured nodes."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+
+        sig = addnodes.desc_signature("", "")
+        directive._create_standard_signature(
+            sig,
+            "Repository",
+            "interface",
+            type_params=["T", "K"],
+            extends=["Base<T>", "Disposable"],
+        )
+
+        assert sig.astext() == (
+            "interface Repository<T, K> extends Base<T>, Disposable"
+        )
+        refs = list(sig.findall(addnodes.pending_xref))
+        assert [ref["reftarget"] for ref in refs] == ["Base", "Disposable"]
+        assert all(ref["refdomain"] == "ts" for ref in refs)
+
+    def test_signature_suffix_is_single_text_node(self) -> None:
+        """Test that trailing signature text is emitted as one node."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+
+        sig = addnodes.desc_signature("", "")
+        directive._create_standard_signature(
+            sig, "Handler", "type", suffix=" = (event: Event) => void"
+        )
+
+        assert sig.astext() == "type Handler = (event: Event) => void"
+        assert isinstance(sig[-1], nodes.Text)
+
 
 class TestErrorHandling:
     """Test error handling in directive processing."""
@@ -460,6 +801,132 @@ class TestUtilityFunctions:
             assert isinstance(result, list)
 
 
+class TestDocCommentRSTCache:
+    """Test reuse of parsed doc comment trees."""
+
+    def setup_method(self) -> None:
+        """Set up a directive whose parses record the current document."""
+        self.directive = TSAutoDirective.__new__(TSAutoDirective)
+        self.directive.content_offset = 0
+        state = Mock()
+        self.env = state.document.settings.env
+
+        def record_document(
+            content: list[str], _offset: int, node: nodes.Element
+        ) -> None:
+            ref = addnodes.pending_xref(
+                "", refdoc=self.env.docname, reftarget="target"
+            )
+            node.append(nodes.paragraph(content[0], "", ref))
+
+        self.nested_parse = MagicMock(side_effect=record_document)
+        state.nested_parse = self.nested_parse
+        self.directive.state = state
+
+    def test_parsed_tree_not_reused_across_documents(self) -> None:
+        """Test that references keep the document they are rendered in."""
+        doc_comment = TSDocComment("/** See :ts:func:`target`. */")
+
+        for docname in ("index", "sub/b", "index"):
+            self.env.docname = docname
+            content = addnodes.desc_content()
+            self.directive._add_standard_doc_content(content, doc_comment)
+
+            (ref,) = content.findall(addnodes.pending_xref)
+            assert ref["refdoc"] == docname
+
+        # The second render of index reuses the first one
+        assert self.nested_parse.call_count == EXPECTED_RST_PARSE_COUNT
+
+    def test_batch_not_reused_across_documents(self) -> None:
+        """Test that batched enum member docs are parsed per document."""
+        self.nested_parse.side_effect = lambda content, _offset, node: (
+            node.extend(publish_doctree("\n".join(content)).children)
+        )
+        doc_comments = [
+            TSDocComment(f"/** Batched member *number* {index}. */")
+            for index in range(2)
+        ]
+
+        for docname in ("index", "sub/b"):
+            self.env.docname = docname
+            self.directive._add_standard_doc_content_batch(
+                [
+                    (addnodes.desc_content(), doc_comment)
+                    for doc_comment in doc_comments
+                ]
+            )
+
+        assert self.nested_parse.call_count == EXPECTED_RST_PARSE_COUNT
+
+    def test_version_changes_are_parsed_every_time(self) -> None:
+        """Test that trees with changesets or IDs are not replayed."""
+        self.env.docname = "index"
+        self.nested_parse.side_effect = lambda content, _offset, node: (
+            node.append(
+                addnodes.versionmodified(content[0], "", type="deprecated")
+            )
+        )
+        doc_comment = TSDocComment("/** @deprecated 1.2 Use other. */")
+
+        for _ in range(2):
+            self.directive._add_standard_doc_content(
+                addnodes.desc_content(), doc_comment
+            )
+
+        assert self.nested_parse.call_count == EXPECTED_RST_PARSE_COUNT
+
+    def test_doc_comment_rst_parsed_once(self) -> None:
+        """Test that identical doc comments reuse the parsed tree."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+        directive.content_offset = 0
+        nested_parse = MagicMock(
+            side_effect=lambda content, _offset, node: node.append(
+                nodes.paragraph(text=content[0])
+            )
+        )
+        directive.state = Mock(nested_parse=nested_parse)
+
+        doc_comment = TSDocComment("""
+        /**
+         * A *description* only parsed a single time.
+         */
+        """)
+
+        first = addnodes.desc_content()
+        second = addnodes.desc_content()
+        directive._add_standard_doc_content(first, doc_comment)
+        directive._add_standard_doc_content(second, doc_comment)
+
+        assert nested_parse.call_count == 1
+        assert first.astext() == second.astext()
+        assert first.children[0] is not second.children[0]
+
+    def test_doc_comment_batch_parsed_once(self) -> None:
+        """Test that batched doc comments are parsed in a single pass."""
+        directive = TSAutoDirective.__new__(TSAutoDirective)
+        directive.content_offset = 0
+        nested_parse = MagicMock(
+            side_effect=lambda content, _offset, node: node.extend(
+                publish_doctree("\n".join(content)).children
+            )
+        )
+        directive.state = Mock(nested_parse=nested_parse)
+
+        targets = [
+            (
+                addnodes.desc_content(),
+                TSDocComment(f"/** Batched member *number* {index}. */"),
+            )
+            for index in range(3)
+        ]
+        directive._add_standard_doc_content_batch(targets)
+
+        assert nested_parse.call_count == 1
+        for index, (content, _) in enumerate(targets):
+            assert content.astext() == f"Batched member number {index}."
+
+
 class TestTSAutoEnumDirective:
     """Test TSAutoEnumDirective functionality."""
 
@@ -526,5 +993,38 @@ class TestTSAutoEnumDirective:
         assert signature == "READ = 1 << 0"
 
 
+class TestTSAutoDataDirective:
+    """Test TSAutoDataDirective functionality."""
+
+    @pytest.mark.parametrize(
+        ("kind", "value", "value_type", "expected"),
+        [
+            ("const", "{ a: 1 }", "object", True),
+            ("const", "[1, 2]", "number[]", True),
+            ("const", "Object.freeze({ a: 1 })", "unknown", True),
+            ("const", "someCall()", "unknown", False),
+            ("const", '"{name}"', "string", False),
+            ("let", "{ a: 1 }", "object", False),
+        ],
+    )
+    def test_is_complex_const(
+        self, kind: str, value: str, value_type: str, *, expected: bool
+    ) -> None:
+        """Test that braces are only scanned for unclassified values."""
+        directive = TSAutoDataDirective.__new__(TSAutoDataDirective)
+
+        ts_variable = TSVariable("CONFIG")
+        ts_variable.kind = kind
+        ts_variable.value = value
+
+        value_data = {
+            "type": value_type,
+            "value": value,
+            "properties": [],
+            "is_complex": value_type == "object" or value_type.endswith("[]"),
+        }
+        assert directive._is_complex_const(ts_variable, value_data) is expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
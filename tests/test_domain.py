@@ -3,9 +3,21 @@
 from unittest.mock import Mock
 
 import pytest
+from docutils import nodes
+from sphinx import addnodes
 from sphinx.environment import BuildEnvironment
 
-from sphinx_ts.domain import TSXRefRole, TypeScriptDomain
+from sphinx_ts.domain import (
+    SignatureParameter,
+    TSClass,
+    TSMethod,
+    TSProperty,
+    TSVariable,
+    TSXRefRole,
+    TypeScriptDomain,
+    TypeScriptObject,
+    parse_parameters_from_signature,
+)
 
 # Test constants
 EXPECTED_OBJECTS_COUNT = 3
@@ -77,13 +89,9 @@ class TestTypeScriptDomain:
         """Test noting objects for cross-referencing."""
         self.domain.note_object("class", "MyClass", "class-MyClass")
 
-        assert "class" in self.domain.data["objects"]
-        assert "MyClass" in self.domain.data["objects"]["class"]
-        assert self.domain.data["objects"]["class"]["MyClass"] == (
-            "test_doc",
-            "",
-            False,
-        )
+        assert self.domain.data["objects"] == {
+            ("class", "MyClass"): ("test_doc", "", False)
+        }
 
     def test_clear_doc(self) -> None:
         """Test clearing document data."""
@@ -97,25 +105,45 @@ class TestTypeScriptDomain:
         self.domain.clear_doc("test_doc")
 
         # Check that objects from this document are removed
-        if "class" in self.domain.data["objects"]:
-            assert "MyClass" not in self.domain.data["objects"]["class"]
-        if "interface" in self.domain.data["objects"]:
-            assert "MyInterface" not in self.domain.data["objects"]["interface"]
+        assert ("class", "MyClass") not in self.domain.data["objects"]
+        assert ("interface", "MyInterface") not in self.domain.data["objects"]
+        assert self.domain.data["by_name"] == {}
 
     def test_merge_domaindata(self) -> None:
         """Test merging domain data from different sources."""
         other_data = {
-            "objects": {"class": {"OtherClass": ("other_doc", "synopsis")}}
+            "objects": {
+                ("class", "OtherClass"): ("other_doc", "synopsis"),
+                ("class", "SkippedClass"): ("skipped_doc", "synopsis"),
+            },
+            "by_doc": {
+                "other_doc": {("class", "OtherClass")},
+                "skipped_doc": {("class", "SkippedClass")},
+            },
         }
 
         self.domain.merge_domaindata({"other_doc"}, other_data)
 
-        assert "class" in self.domain.data["objects"]
-        assert "OtherClass" in self.domain.data["objects"]["class"]
-        assert self.domain.data["objects"]["class"]["OtherClass"] == (
-            "other_doc",
-            "synopsis",
-        )
+        assert self.domain.data["objects"] == {
+            ("class", "OtherClass"): ("other_doc", "synopsis", False)
+        }
+        assert self.domain.data["by_doc"] == {
+            "other_doc": {("class", "OtherClass")}
+        }
+
+    def test_clear_doc_keeps_objects_registered_again_elsewhere(self) -> None:
+        """Test that clearing a document spares keys another doc took over."""
+        self.domain.note_object("class", "MyClass", "class-MyClass")
+        self.env.docname = "other_doc"
+        self.domain.note_object("class", "MyClass", "class-MyClass")
+
+        self.domain.clear_doc("test_doc")
+
+        assert self.domain.data["objects"] == {
+            ("class", "MyClass"): ("other_doc", "", False)
+        }
+        assert "test_doc" not in self.domain.data["by_doc"]
+        assert self.domain.data["by_name"] == {"MyClass": {"class"}}
 
     def test_resolve_xref_not_found(self) -> None:
         """Test resolving cross-references when target is not found."""
@@ -135,6 +163,59 @@ class TestTypeScriptDomain:
 
         assert result is None
 
+    def test_resolve_xref_obj_searches_registered_types(self) -> None:
+        """Test that ``:obj:`` resolves through the types a name is under."""
+        self.domain.note_object("variable", "config", "variable-config")
+
+        result = self.domain.resolve_xref(
+            Mock(spec=BuildEnvironment),
+            "test_doc",
+            Mock(),
+            "obj",
+            "config",
+            Mock(),
+            nodes.literal("", "config"),
+        )
+
+        assert result is not None
+        assert result["refid"] == "variable-config"
+
+    def test_resolve_xref_qualified_method(self) -> None:
+        """Test that qualified members are titled by the member name."""
+        self.domain.note_object("method", "Shape.area", "method-Shape.area")
+
+        result = self.domain.resolve_xref(
+            Mock(spec=BuildEnvironment),
+            "test_doc",
+            Mock(),
+            "meth",
+            "Shape.area",
+            Mock(),
+            nodes.literal("", "Shape.area"),
+        )
+
+        assert result is not None
+        assert result["refid"] == "method-Shape.area"
+        assert result["reftitle"] == "area"
+
+    def test_resolve_xref_property_falls_back_to_method(self) -> None:
+        """Test that a property reference can resolve to a getter method."""
+        self.domain.note_object("method", "Shape.area", "method-Shape.area")
+
+        result = self.domain.resolve_xref(
+            Mock(spec=BuildEnvironment),
+            "test_doc",
+            Mock(),
+            "prop",
+            "Shape.area",
+            Mock(),
+            nodes.literal("", "area"),
+        )
+
+        assert result is not None
+        assert result["refid"] == "method-Shape.area"
+        assert result["reftitle"] == "area"
+
     def test_get_objects(self) -> None:
         """Test getting all objects for indexing."""
         # Add test data
@@ -153,6 +234,119 @@ class TestTypeScriptDomain:
             )  # name, dispname, type, docname, anchor, priority
             assert obj[0] in ["MyClass", "MyInterface", "myFunction"]
 
+    def test_get_objects_sorted_by_name_without_noindex(self) -> None:
+        """Test that objects come out sorted and noindex ones are skipped."""
+        self.domain.note_object("variable", "b", "variable-b")
+        self.domain.note_object("class", "c", "class-c")
+        self.domain.note_object("class", "a", "class-a")
+        self.domain.note_object("method", "a.run", "method-a.run", noindex=True)
+
+        objects = list(self.domain.get_objects())
+
+        assert objects == [
+            ("a", "a", "class", "test_doc", "class-a", 1),
+            ("b", "b", "variable", "test_doc", "variable-b", 1),
+            ("c", "c", "class", "test_doc", "class-c", 1),
+        ]
+
+
+class TestParseParameters:
+    """Test splitting signatures into parameters."""
+
+    def test_splits_only_at_top_level_commas(self) -> None:
+        """Test that commas inside brackets don't split parameters."""
+        params = parse_parameters_from_signature(
+            "merge(a: Map<string, number>, b: { x: number, y: number }, "
+            "c: [number, string])"
+        )
+
+        assert [param.name for param in params] == ["a", "b", "c"]
+        assert params[0].type == "Map<string, number>"
+        assert params[1].type == "{ x: number, y: number }"
+
+    def test_arrow_function_types_do_not_close_brackets(self) -> None:
+        """Test that the ``>`` of ``=>`` isn't counted as a bracket."""
+        params = parse_parameters_from_signature(
+            "on(event: string, cb: (data: Event) => void, once: boolean)"
+        )
+
+        assert [param.name for param in params] == ["event", "cb", "once"]
+
+    def test_optional_and_default_values(self) -> None:
+        """Test optional markers and defaults, including arrow types."""
+        optional, arrow, text = parse_parameters_from_signature(
+            'f(limit?: number, cb: (x: T) => void = noop, sep: string = "=")'
+        )
+
+        assert optional == SignatureParameter("limit", "number", optional=True)
+        assert arrow == SignatureParameter(
+            "cb", "(x: T) => void", default="noop"
+        )
+        assert text.default == '"="'
+
+    def test_common_types_and_short_names_are_interned(self) -> None:
+        """Test that repeated types and names share one string object."""
+        (first,) = parse_parameters_from_signature("f(count: number)")
+        (second,) = parse_parameters_from_signature("g(count:  number )")
+
+        assert first.type is second.type
+        assert first.name is second.name
+
+    def test_repeated_signatures_share_parsed_parameters(self) -> None:
+        """Test that identical parameter lists are parsed once."""
+        first = parse_parameters_from_signature("f(a: string, b?: number)")
+        second = parse_parameters_from_signature("g(a: string, b?: number)")
+
+        assert first is second
+
+    def test_no_parameters(self) -> None:
+        """Test signatures without a parameter list or parameters."""
+        assert parse_parameters_from_signature("value") == ()
+        assert parse_parameters_from_signature("run( )") == ()
+
+
+class TestHandleSignature:
+    """Test turning directive signatures into signature nodes."""
+
+    @pytest.mark.parametrize(
+        ("directive_class", "sig", "expected_name", "expected_text"),
+        [
+            (TSClass, "Repository<T>", "Repository<T>", "class Repository<T>"),
+            (TSProperty, "sides : number", "sides", "sides: number"),
+            (TSVariable, "LIMIT: number = 10", "LIMIT", "LIMIT: number = 10"),
+            (TSVariable, "LIMIT", "LIMIT", "LIMIT"),
+        ],
+    )
+    def test_handle_signature(
+        self,
+        directive_class: type[TypeScriptObject],
+        sig: str,
+        expected_name: str,
+        expected_text: str,
+    ) -> None:
+        """Test the returned name and the rendered signature text."""
+        directive = directive_class.__new__(directive_class)
+        signode = addnodes.desc_signature("", "")
+
+        assert directive.handle_signature(sig, signode) == expected_name
+        assert signode.astext() == expected_text
+
+    def test_handle_method_signature(self) -> None:
+        """Test that method parameters become parameter nodes."""
+        directive = TSMethod.__new__(TSMethod)
+        signode = addnodes.desc_signature("", "")
+
+        name = directive.handle_signature(
+            "on(event: string, cb?: () => void)", signode
+        )
+
+        assert name == "on"
+        params = list(signode.findall(addnodes.desc_parameter))
+        assert [param.astext() for param in params] == [
+            "event: string",
+            "cb?: () => void",
+        ]
+
 
 class TestTSXRefRole:
     """Test the TypeScript cross-reference role."""
@@ -25,7 +25,7 @@ from sphinx_ts.parser import (
 
 # Test constants
 EXPECTED_DIRECTIVES_COUNT = 4
-EXPECTED_CONFIG_VALUES_COUNT = 8
+EXPECTED_CONFIG_VALUES_COUNT = 9
 
 
 class MockSphinxApp:
@@ -38,6 +38,7 @@ class MockSphinxApp:
         self.added_domains = []
         self.added_directives = []
         self.added_config_values = []
+        self.connected_events = []
 
     def add_domain(self, domain: type, *, override: bool = False) -> None:
         """Mock add_domain method."""
@@ -63,6 +64,11 @@ class MockSphinxApp:
         self.added_config_values.append((name, default, rebuild, types))
         self.config_values[name] = (default, rebuild, types)
 
+    def connect(self, event: str, callback: object) -> int:
+        """Mock connect method."""
+        self.connected_events.append((event, callback))
+        return len(self.connected_events)
+
 
 class TestExtensionSetup:
     """Test the main extension setup function."""
@@ -124,12 +130,21 @@ class TestExtensionSetup:
             ("sphinx_ts_source_base_url", None, "env", [str]),
             ("sphinx_ts_source_branch", "main", "env", [str]),
             ("sphinx_ts_show_source_links", True, "env", [bool]),
+            ("sphinx_ts_multi_block_examples", False, "env", [bool]),
         ]
 
         assert len(app.added_config_values) == EXPECTED_CONFIG_VALUES_COUNT
         for expected_config in expected_configs:
             assert expected_config in app.added_config_values
 
+    def test_setup_saves_parse_cache_after_build(self) -> None:
+        """Test that parsed sources are loaded and saved around builds."""
+        app = MockSphinxApp()
+        setup(app)  # type: ignore
+
+        events = [event for event, _callback in app.connected_events]
+        assert events == ["builder-inited", "build-finished"]
+
     def test_setup_with_real_sphinx_app_mock(self) -> None:
         """Test setup with a more realistic Sphinx app mock."""
         with patch("sphinx.application.Sphinx") as mock_app_class:
@@ -1,8 +1,11 @@
 """Tests for the TypeScript parser module."""
 
+import os
+import pickle
 import shutil
 import tempfile
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
@@ -13,9 +16,15 @@ from sphinx_ts.parser import (
     TSEnumMember,
     TSInterface,
     TSMethod,
+    TSParseCache,
     TSParser,
+    TSValueParser,
     TSVariable,
 )
+from sphinx_ts.parser.parse_cache import CACHE_VERSION
+
+# Test constants
+PARSES_AFTER_EDIT = 2
 
 
 class TestTSDocComment:
@@ -49,6 +58,22 @@ class TestTSDocComment:
         assert doc.params["b"] == "The second number"
         assert doc.returns == "The sum of a and b"
 
+    def test_sorted_params_computed_once(self) -> None:
+        """Test that sorted parameters are cached on the comment."""
+        comment_text = """
+        /**
+         * Config values.
+         * @param zeta The last value
+         * @param alpha The first value
+         */
+        """
+        doc = TSDocComment(comment_text)
+        assert doc.sorted_params == [
+            ("alpha", "The first value"),
+            ("zeta", "The last value"),
+        ]
+        assert doc.sorted_params is doc.sorted_params
+
     def test_comment_with_example(self) -> None:
         """Test parsing JSDoc comment with examples."""
         comment_text = """
@@ -309,6 +334,17 @@ class TestTSMemberClasses:
         assert ts_method.parameters == []
         assert not ts_method.is_async
 
+    @pytest.mark.parametrize(
+        "node_class",
+        [TSClass, TSInterface, TSVariable, TSMethod, TSEnum, TSEnumMember],
+    )
+    def test_nodes_have_no_instance_dict(self, node_class: type) -> None:
+        """Test that AST nodes store their fields in slots."""
+        node = node_class("name")
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.unknown_field = True
+
 
 class TestTSEnumClasses:
     """Test TypeScript enum data classes."""
@@ -488,5 +524,101 @@ export enum Permission {
             shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+class TestTSValueParser:
+    """Test TypeScript value parsing and formatting."""
+
+    def test_parse_value_types(self) -> None:
+        """Test detecting the type of simple and complex values."""
+        assert TSValueParser.parse_value("42")["type"] == "number"
+        assert TSValueParser.parse_value("'hi'")["type"] == "string"
+        assert TSValueParser.parse_value("[1, 2]")["type"] == "number[]"
+        assert TSValueParser.parse_value("{ a: 1 }")["type"] == "object"
+        assert TSValueParser.parse_value(None)["type"] == "unknown"
+
+    def test_parse_value_shape_flags(self) -> None:
+        """Test the array and complex flags derived from the value type."""
+        for value, is_array, is_complex in (
+            ("42", False, False),
+            ("{ a: 1 }", False, True),
+            ("[1, 2]", True, True),
+            ("[1, 'a']", True, False),
+            ("", False, False),
+        ):
+            parsed = TSValueParser.parse_value(value)
+            assert parsed["is_array"] is is_array
+            assert parsed["is_complex"] is is_complex
+
+    def test_parse_and_format_are_memoized(self) -> None:
+        """Test that repeated values are served from the cache."""
+        value = "{ cached: true, answer: 42 }"
+
+        assert TSValueParser.parse_value(value) is TSValueParser.parse_value(
+            value
+        )
+        hits = TSValueParser.format_value.cache_info().hits
+        formatted = TSValueParser.format_value(value)
+        assert TSValueParser.format_value(value) == formatted
+        assert TSValueParser.format_value.cache_info().hits == hits + 1
+
+    def test_parse_and_format_matches_separate_calls(self) -> None:
+        """Test that the fused call agrees with parse_value/format_value."""
+        for value in ("42", "'hi'", "[1, 2, 3]", "{ a: 1, b: { c: 2 } }", ""):
+            parsed, formatted = TSValueParser.parse_and_format(value)
+            assert parsed == TSValueParser.parse_value(value)
+            assert formatted == TSValueParser.format_value(value)
+
+
+class TestTSParseCache:
+    """Test the persistent cache of parsed source files."""
+
+    def test_unchanged_file_is_parsed_once_across_builds(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a saved cache serves unchanged files without parsing."""
+        source = tmp_path / "shapes.ts"
+        source.write_text("export interface Shape { area: number; }")
+        cache_path = tmp_path / "doctrees" / "parse-cache.pickle"
+        parser = Mock(wraps=TSParser())
+
+        first = TSParseCache(cache_path)
+        first.parse_file(parser, source)
+        first.save()
+
+        parsed = TSParseCache(cache_path).parse_file(parser, source)
+        assert parser.parse_file.call_count == 1
+        assert [i.name for i in parsed["interfaces"]] == ["Shape"]
+
+    def test_touched_file_is_not_parsed_again(self, tmp_path: Path) -> None:
+        """Test that a new modification time alone does not reparse."""
+        source = tmp_path / "shapes.ts"
+        source.write_text("export const SIDES = 4;")
+        cache = TSParseCache(tmp_path / "parse-cache.pickle")
+        parser = Mock(wraps=TSParser())
+
+        cache.parse_file(parser, source)
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        cache.parse_file(parser, source)
+        assert parser.parse_file.call_count == 1
+
+        source.write_text("export const SIDES = 5;")
+        parsed = cache.parse_file(parser, source)
+        assert parser.parse_file.call_count == PARSES_AFTER_EDIT
+        assert parsed["variables"][0].value == "5"
+
+    def test_cache_from_other_version_is_ignored(self, tmp_path: Path) -> None:
+        """Test that entries saved by another cache version are discarded."""
+        source = tmp_path / "shapes.ts"
+        source.write_text("export const SIDES = 4;")
+        cache_path = tmp_path / "parse-cache.pickle"
+        stat = source.stat()
+        stale = {str(source): (stat.st_mtime_ns, stat.st_size, b"", {})}
+        cache_path.write_bytes(pickle.dumps((CACHE_VERSION + 1, stale)))
+        parser = Mock(wraps=TSParser())
+
+        TSParseCache(cache_path).parse_file(parser, source)
+        parser.parse_file.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])